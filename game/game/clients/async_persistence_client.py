@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Asyncio HTTP client for interacting with the persistence service.
+
+Kept apart from :mod:`game.clients.persistence_client` so ``httpx`` and
+``asyncio`` are only imported by code that actually awaits the service.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import MutableMapping
+
+import httpx
+
+from game.clients.persistence_client import _POOL_MAXSIZE, _resolve_base_url
+
+
+class AsyncPersistenceClient:
+    """Asyncio counterpart of :class:`PersistenceClient` built on ``httpx.AsyncClient``.
+
+    Calls can be awaited together (e.g. ``asyncio.gather`` of a leaderboard
+    fetch and a result save) so independent requests overlap over the pooled
+    keep-alive connections instead of running back to back.
+
+    Attributes:
+        base_url (str): Base URL of the persistence service (e.g., http://persistence:8000).
+        timeout (int): Request timeout in seconds.
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        timeout: int = 5,
+        *,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            base_url: Full base URL of the persistence service. If None, uses PERSISTENCE_URL env var.
+            timeout: Request timeout in seconds.
+            transport: Optional httpx transport (used by tests to stub the service).
+        """
+        self.base_url = _resolve_base_url(base_url)
+        self.timeout = timeout
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            headers={"Accept": "application/json"},
+            limits=httpx.Limits(max_connections=_POOL_MAXSIZE, max_keepalive_connections=_POOL_MAXSIZE),
+            transport=transport,
+        )
+
+    async def fetch_leaderboard(self, limit: int = 10) -> list[MutableMapping[str, object]]:
+        """Fetch leaderboard rows from the persistence service.
+
+        Args:
+            limit: Maximum number of rows to retrieve.
+
+        Returns:
+            List of leaderboard entries.
+
+        Raises:
+            RuntimeError: If the remote call fails.
+        """
+        resp = await self._client.get("/leaderboard", params={"limit": limit})
+        if resp.status_code != 200:
+            raise RuntimeError(f"Failed to fetch leaderboard: {resp.status_code} {resp.text}")
+        return resp.json()
+
+    async def fetch_history(self, limit: int = 200) -> list[MutableMapping[str, object]]:
+        """Fetch recent game history rows for analytics.
+
+        Args:
+            limit: Maximum number of rows to retrieve (defaults to 200).
+
+        Returns:
+            List of recent game entries, newest first.
+
+        Raises:
+            RuntimeError: If the remote call fails.
+        """
+        resp = await self._client.get("/history", params={"limit": limit})
+        if resp.status_code != 200:
+            raise RuntimeError(f"Failed to fetch history: {resp.status_code} {resp.text}")
+        return resp.json()
+
+    async def record_result(
+        self,
+        player_name: str,
+        board_size: int,
+        pool_max: int,
+        won: bool,
+        draws_count: int,
+    ) -> None:
+        """Send a game result to the persistence service.
+
+        Args:
+            player_name: Display name of the player.
+            board_size: Board dimension (N for N×N grid).
+            pool_max: Maximum number in the draw pool.
+            won: Whether the player won.
+            draws_count: Number of draws taken.
+
+        Raises:
+            RuntimeError: If the remote call fails.
+        """
+        payload: dict[str, object] = {
+            "player_name": player_name,
+            "board_size": board_size,
+            "pool_max": pool_max,
+            "won": won,
+            "draws_count": draws_count,
+        }
+        resp = await self._client.post("/results", json=payload)
+        if resp.status_code not in (200, 201):
+            raise RuntimeError(f"Failed to save result: {resp.status_code} {resp.text}")
+
+    async def record_results(self, rows: list[MutableMapping[str, object]]) -> None:
+        """Send several game results to the persistence service in one request.
+
+        Falls back to concurrent ``record_result`` calls when the service does not
+        expose the batch route (HTTP 404), with at most one call in flight per
+        pooled connection. An empty ``rows`` sends nothing.
+
+        Args:
+            rows: Result payloads with keys player_name, board_size, pool_max, won, draws_count.
+
+        Raises:
+            RuntimeError: If the remote call fails.
+        """
+        if not rows:
+            return
+        resp = await self._client.post("/results/batch", json={"results": rows})
+        if resp.status_code == 404:
+            slots = asyncio.Semaphore(_POOL_MAXSIZE)
+
+            async def record(row: MutableMapping[str, object]) -> None:
+                async with slots:
+                    await self.record_result(**row)
+
+            await asyncio.gather(*(record(row) for row in rows))
+            return
+        if resp.status_code not in (200, 201):
+            raise RuntimeError(f"Failed to save results: {resp.status_code} {resp.text}")
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> AsyncPersistenceClient:
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        """Async context manager exit - closes the client."""
+        await self.aclose()
@@ -5,8 +5,28 @@ from __future__ import annotations
 
 import os
 from collections.abc import MutableMapping
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Only one host is ever contacted; a handful of connections covers the history,
+# leaderboard and save calls a single rerun can make.
+_POOL_MAXSIZE = 8
+
+
+def _resolve_base_url(base_url: str | None) -> str:
+    """Return ``base_url`` (or ``PERSISTENCE_URL``) without a trailing slash.
+
+    Raises:
+        RuntimeError: If neither is set.
+    """
+    if base_url is None:
+        base_url = os.environ.get("PERSISTENCE_URL")
+        if not base_url:
+            raise RuntimeError("PERSISTENCE_URL is not set and no base_url provided")
+    return base_url.rstrip("/")
 
 
 class PersistenceClient:
@@ -15,6 +35,10 @@ class PersistenceClient:
     Attributes:
         base_url (str): Base URL of the persistence service (e.g., http://persistence:8000).
         timeout (int): Request timeout in seconds.
+
+    A single ``requests.Session`` is kept per client so HTTP keep-alive and
+    connection pooling are reused across calls. Supports context manager usage
+    for automatic session cleanup.
     """
 
     def __init__(self, base_url: str | None = None, timeout: int = 5) -> None:
@@ -24,13 +48,35 @@ class PersistenceClient:
             base_url: Full base URL of the persistence service. If None, uses PERSISTENCE_URL env var.
             timeout: Request timeout in seconds.
         """
-        env_url = os.environ.get("PERSISTENCE_URL")
-        if base_url is None:
-            if not env_url:
-                raise RuntimeError("PERSISTENCE_URL is not set and no base_url provided")
-            base_url = env_url
-        self.base_url = base_url.rstrip("/")
+        self.base_url = _resolve_base_url(base_url)
         self.timeout = timeout
+        self._leaderboard_url = f"{self.base_url}/leaderboard"
+        self._history_url = f"{self.base_url}/history"
+        self._results_url = f"{self.base_url}/results"
+        self._results_batch_url = f"{self.base_url}/results/batch"
+        self._session = requests.Session()
+        self._session.headers.update({"Accept": "application/json"})
+        # Retry connection failures (any method: the request never reached the
+        # server) and, for GETs only, gateway errors with a short backoff; the
+        # Streamlit rerun blocks on these calls, so a down service must still fail
+        # fast. POSTs are not replayed after a read error or a 502/503/504: the
+        # server may already have stored the result, and a retry would record the
+        # game twice.
+        retry = Retry(
+            total=3,
+            connect=2,
+            read=0,
+            status=2,
+            backoff_factor=0.1,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=2, pool_maxsize=_POOL_MAXSIZE, pool_block=False, max_retries=retry
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
 
     def fetch_leaderboard(self, limit: int = 10) -> list[MutableMapping[str, object]]:
         """Fetch leaderboard rows from the persistence service.
@@ -44,7 +90,7 @@ class PersistenceClient:
         Raises:
             RuntimeError: If the remote call fails.
         """
-        resp = requests.get(f"{self.base_url}/leaderboard", params={"limit": limit}, timeout=self.timeout)
+        resp = self._session.get(self._leaderboard_url, params={"limit": limit}, timeout=self.timeout)
         if resp.status_code != 200:
             raise RuntimeError(f"Failed to fetch leaderboard: {resp.status_code} {resp.text}")
         return resp.json()
@@ -61,7 +107,7 @@ class PersistenceClient:
         Raises:
             RuntimeError: If the remote call fails.
         """
-        resp = requests.get(f"{self.base_url}/history", params={"limit": limit}, timeout=self.timeout)
+        resp = self._session.get(self._history_url, params={"limit": limit}, timeout=self.timeout)
         if resp.status_code != 200:
             raise RuntimeError(f"Failed to fetch history: {resp.status_code} {resp.text}")
         return resp.json()
@@ -93,6 +139,46 @@ class PersistenceClient:
             "won": won,
             "draws_count": draws_count,
         }
-        resp = requests.post(f"{self.base_url}/results", json=payload, timeout=self.timeout)
+        resp = self._session.post(self._results_url, json=payload, timeout=self.timeout)
         if resp.status_code not in (200, 201):
             raise RuntimeError(f"Failed to save result: {resp.status_code} {resp.text}")
+
+    def record_results(self, rows: list[MutableMapping[str, object]]) -> None:
+        """Send several game results to the persistence service in one request.
+
+        Falls back to one ``record_result`` call per row when the service does not
+        expose the batch route (HTTP 404); those calls run concurrently over the
+        pooled session (at most one thread per pooled connection), so the fallback
+        costs a few round-trips, not one per row. An empty ``rows`` sends nothing.
+
+        Args:
+            rows: Result payloads with keys player_name, board_size, pool_max, won, draws_count.
+
+        Raises:
+            RuntimeError: If the remote call fails.
+        """
+        if not rows:
+            return
+        resp = self._session.post(self._results_batch_url, json={"results": rows}, timeout=self.timeout)
+        if resp.status_code == 404:
+            with ThreadPoolExecutor(max_workers=min(len(rows), _POOL_MAXSIZE)) as pool:
+                list(pool.map(lambda row: self.record_result(**row), rows))
+            return
+        if resp.status_code not in (200, 201):
+            raise RuntimeError(f"Failed to save results: {resp.status_code} {resp.text}")
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections.
+
+        Safe to call multiple times (idempotent).
+        """
+        self._session.close()
+
+    def __enter__(self) -> PersistenceClient:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
+        """Context manager exit - closes the session."""
+        self.close()
+
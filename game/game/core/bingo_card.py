@@ -1,59 +1,251 @@
 #!/usr/bin/env python3
 import random
+from collections.abc import Iterable
+from functools import cache
+
+import numpy as np
+
+
+@cache
+def _line_masks(n: int) -> tuple[int, ...]:
+    """Bitmasks (bit r*n + c) for every row, column and both diagonals of an N×N card."""
+    rows = [((1 << n) - 1) << (r * n) for r in range(n)]
+    cols = [sum(1 << (r * n + c) for r in range(n)) for c in range(n)]
+    diag = sum(1 << (i * n + i) for i in range(n))
+    anti = sum(1 << (i * n + n - 1 - i) for i in range(n))
+    return (*rows, *cols, diag, anti)
+
+
+@cache
+def _cell_line_masks(n: int) -> tuple[tuple[int, ...], ...]:
+    """For each cell index r*n + c, the line masks that pass through that cell."""
+    return tuple(tuple(line for line in _line_masks(n) if line >> i & 1) for i in range(n * n))
 
 
 class BingoCard:
     """Generates and manages an N×N bingo card with unique, non-repeating numbers."""
 
     def __init__(self, n: int, pool_max: int, *, free_center: bool = False, seed: int | None = None):
-        if n not in (3, 4, 5):
-            raise ValueError("Board size N must be 3, 4, or 5")
-        if pool_max < n * n:
-            raise ValueError("pool_max must be at least N*N to ensure unique values.")
-        if free_center and n % 2 == 0:
-            raise ValueError("Free center is only available for odd-sized boards.")
+        self._validate(n, pool_max, free_center)
         self.n = n
         self.pool_max = pool_max
         self.free_center = bool(free_center) and n % 2 == 1
         self._center = (n // 2, n // 2) if n % 2 == 1 else None
         self._rng = random.Random(seed)
         self.grid: list[list[int]] = []
-        self.marked: set[tuple[int, int]] = set()
+        self.str_grid: tuple[tuple[str, ...], ...] = ()  # display labels, "FREE" at a free center
+        self._cells: tuple[tuple[str, ...], ...] = ()  # labels right-aligned for render()
+        self._header_cells: tuple[str, ...] = ()
+        self._num_to_pos: dict[int, tuple[int, int]] = {}
+        self._cell_lines = _cell_line_masks(n)
+        self._reset_marks()
         self._generate()
 
+    @staticmethod
+    def _validate(n: int, pool_max: int, free_center: bool) -> None:
+        if n not in (3, 4, 5):
+            raise ValueError("Board size N must be 3, 4, or 5")
+        if pool_max < n * n:
+            raise ValueError("pool_max must be at least N*N to ensure unique values.")
+        if free_center and n % 2 == 0:
+            raise ValueError("Free center is only available for odd-sized boards.")
+
+    @classmethod
+    def generate_many(
+        cls,
+        count: int,
+        n: int,
+        pool_max: int,
+        *,
+        free_center: bool = False,
+        seed: int | None = None,
+    ) -> np.ndarray:
+        """Generate many card grids at once for batch simulations.
+
+        Each row of ``count`` random keys is argsorted, so every card holds N*N
+        distinct numbers from 1 to ``pool_max`` without a Python-level loop.
+
+        Args:
+            count (int): Number of cards to generate.
+            n (int): Board dimension (3, 4, or 5).
+            pool_max (int): Maximum number in the draw pool.
+            free_center (bool): Put the ``0`` free-slot sentinel at the center (odd N only).
+            seed (Optional[int]): Seed for reproducible batches.
+
+        Returns:
+            np.ndarray: ``int32`` array of shape ``(count, n, n)``.
+        """
+        cls._validate(n, pool_max, free_center)
+        return cls._generate_grids(np.random.default_rng(seed), count, n, pool_max, free_center)
+
+    @staticmethod
+    def _generate_grids(
+        rng: np.random.Generator, count: int, n: int, pool_max: int, free_center: bool
+    ) -> np.ndarray:
+        picks = np.argsort(rng.random((count, pool_max)), axis=1)[:, : n * n] + 1
+        grids = picks.astype(np.int32).reshape(count, n, n)
+        if free_center:
+            grids[:, n // 2, n // 2] = 0
+        return grids
+
+    @staticmethod
+    def has_bingo_batch(marked_masks: np.ndarray, n: int) -> np.ndarray:
+        """Check many ``marked_mask`` values for a completed line at once.
+
+        Args:
+            marked_masks (np.ndarray): Integer masks, bit ``r*n + c`` set per marked cell.
+            n (int): Board dimension shared by every mask.
+
+        Returns:
+            np.ndarray: Boolean array, ``True`` where the mask contains a winning line.
+        """
+        lines = np.array(_line_masks(n), dtype=np.int64)
+        masks = np.asarray(marked_masks, dtype=np.int64)[..., np.newaxis]
+        return ((masks & lines) == lines).any(axis=-1)
+
+    @staticmethod
+    def draws_to_bingo(grids: np.ndarray, draw_orders: np.ndarray) -> np.ndarray:
+        """Count the draws each card needs to complete its first line.
+
+        Instead of replaying draws one at a time, every cell is tagged with the
+        draw number that hits it; a line completes at its latest cell and the
+        card wins at its earliest completed line.
+
+        Args:
+            grids (np.ndarray): Card grids of shape ``(count, n, n)``; ``0`` is a free slot.
+            draw_orders (np.ndarray): Shape ``(count, pool_max)``, each row a permutation
+                of ``1..pool_max`` giving that game's draw sequence.
+
+        Returns:
+            np.ndarray: ``int64`` array of shape ``(count,)`` with 1-based draw counts.
+        """
+        grids = np.asarray(grids)
+        draw_orders = np.asarray(draw_orders)
+        count, pool_max = draw_orders.shape
+        games = np.arange(count)[:, np.newaxis]
+        # draw_at[g, v] is the draw that calls number v in game g; index 0 (free slot) is 0
+        draw_at = np.zeros((count, pool_max + 1), dtype=np.int64)
+        draw_at[games, draw_orders] = np.arange(1, pool_max + 1)
+        hit = draw_at[games, grids.reshape(count, -1)].reshape(grids.shape)
+        line_done = np.concatenate(
+            (
+                hit.max(axis=2),
+                hit.max(axis=1),
+                hit.diagonal(axis1=1, axis2=2).max(axis=1, keepdims=True),
+                hit[:, :, ::-1].diagonal(axis1=1, axis2=2).max(axis=1, keepdims=True),
+            ),
+            axis=1,
+        )
+        return line_done.min(axis=1)
+
+    @classmethod
+    def simulate_games(
+        cls,
+        count: int,
+        n: int,
+        pool_max: int,
+        *,
+        free_center: bool = False,
+        seed: int | None = None,
+    ) -> np.ndarray:
+        """Simulate many single-card games and report how long each took to win.
+
+        Args:
+            count (int): Number of games to simulate.
+            n (int): Board dimension (3, 4, or 5).
+            pool_max (int): Maximum number in the draw pool.
+            free_center (bool): Give every card a free center (odd N only).
+            seed (Optional[int]): Seed for reproducible simulations.
+
+        Returns:
+            np.ndarray: Draws needed for a bingo in each game, shape ``(count,)``.
+        """
+        cls._validate(n, pool_max, free_center)
+        rng = np.random.default_rng(seed)
+        grids = cls._generate_grids(rng, count, n, pool_max, free_center)
+        draw_orders = np.argsort(rng.random((count, pool_max)), axis=1) + 1
+        return cls.draws_to_bingo(grids, draw_orders)
+
+    def _reset_marks(self) -> None:
+        self.marked_mask = 0  # bit r*n + c set when cell (r, c) is marked
+        self._won = False
+
+    def _set_cell(self, r: int, c: int, on: bool) -> None:
+        n = self.n
+        i = r * n + c
+        bit = 1 << i
+        if bool(self.marked_mask & bit) == on:
+            return
+        self.marked_mask ^= bit
+        mask = self.marked_mask
+        if on:
+            # Only the 2-4 lines through (r, c) can have just been completed.
+            self._won = self._won or any((mask & line).bit_count() == n for line in self._cell_lines[i])
+        elif self._won:
+            self._won = any(mask & line == line for line in _line_masks(n))
+
+    @property
+    def marked(self) -> frozenset[tuple[int, int]]:
+        """Marked cell coordinates, derived from ``marked_mask``."""
+        n = self.n
+        mask = self.marked_mask
+        return frozenset(divmod(i, n) for i in range(n * n) if mask >> i & 1)
+
+    @marked.setter
+    def marked(self, cells: Iterable[tuple[int, int]]) -> None:
+        mask = 0
+        for r, c in cells:
+            mask |= 1 << (r * self.n + c)
+        self.marked_mask = mask
+        self._won = any(mask & line == line for line in _line_masks(self.n))
+
+    @property
+    def grid_array(self) -> np.ndarray:
+        """The grid as an ``(n, n)`` ``int16`` array for vectorized consumers."""
+        return np.asarray(self.grid, dtype=np.int16)
+
+    @property
+    def marked_array(self) -> np.ndarray:
+        """Marked cells as an ``(n, n)`` boolean array, derived from ``marked_mask``."""
+        bits = np.arange(self.n * self.n, dtype=np.uint64)
+        return ((np.uint64(self.marked_mask) >> bits) & np.uint64(1)).astype(bool).reshape(self.n, self.n)
+
+    def mark(self, r: int, c: int) -> None:
+        self._set_cell(r, c, True)
+
     def _generate(self) -> None:
         nums = self._rng.sample(range(1, self.pool_max + 1), self.n * self.n)
         self.grid = [nums[i * self.n:(i + 1) * self.n] for i in range(self.n)]
-        self.marked.clear()
+        self._num_to_pos = {num: divmod(i, self.n) for i, num in enumerate(nums)}
+        self._reset_marks()
         if self.free_center and self._center is not None:
             r, c = self._center
+            del self._num_to_pos[self.grid[r][c]]
             self.grid[r][c] = 0  # sentinel value for the free slot
-            self.marked.add((r, c))
+            self.mark(r, c)
+        # Card numbers start at 1, so 0 only ever marks the free slot.
+        self.str_grid = tuple(tuple(str(num) if num else "FREE" for num in row) for row in self.grid)
+        # Padding only depends on the numbers, so render() reuses these strings.
+        w = max(2, len(str(max(nums))), len("FREE"))
+        self._cells = tuple(tuple(f"{label:>{w}}" for label in row) for row in self.str_grid)
+        self._header_cells = tuple(f"{c:>{w}}" for c in range(self.n))
 
     def find(self, number: int) -> tuple[int, int] | None:
-        for r in range(self.n):
-            for c in range(self.n):
-                if self.grid[r][c] == number:
-                    return (r, c)
-        return None
+        return self._num_to_pos.get(number)
 
     def toggle_mark(self, r: int, c: int) -> None:
         if not (0 <= r < self.n and 0 <= c < self.n):
             return
-        pos = (r, c)
-        if self.free_center and self._center == pos:
+        if self.free_center and self._center == (r, c):
             # Free center stays marked; ignore manual toggles.
-            self.marked.add(pos)
+            self.mark(r, c)
             return
-        if pos in self.marked:
-            self.marked.remove(pos)
-        else:
-            self.marked.add(pos)
+        self._set_cell(r, c, not self.marked_mask >> (r * self.n + c) & 1)
 
     def auto_mark_if_present(self, number: int) -> bool:
         loc = self.find(number)
         if loc is not None:
-            self.marked.add(loc)
+            self.mark(*loc)
             return True
         return False
 
@@ -62,40 +254,15 @@ class BingoCard:
         if color_fn is None:
             def color_fn(s, _name=None):
                 return s
-        max_num = max(max(row) for row in self.grid)
-        w = max(2, len(str(max_num)), len("FREE"))
-        lines = []
-        header = "   " + " ".join(color_fn(f"{c:>{w}}", "dim") for c in range(self.n))
-        lines.append(header)
-        for r in range(self.n):
-            row_repr = []
-            for c in range(self.n):
-                num = self.grid[r][c]
-                if self.free_center and self._center == (r, c):
-                    cell_value = "FREE"
-                else:
-                    cell_value = f"{num}"
-                cell = f"{cell_value:>{w}}"
-                if (r, c) in self.marked:
-                    cell = color_fn(cell, "green")
-                row_repr.append(cell)
+        n = self.n
+        mask = self.marked_mask
+        lines = ["   " + " ".join(color_fn(cell, "dim") for cell in self._header_cells)]
+        for r, row in enumerate(self._cells):
+            row_repr = [color_fn(cell, "green") if mask >> (r * n + c) & 1 else cell for c, cell in enumerate(row)]
             lines.append(color_fn(f"{r:>2}", "dim") + " " + " ".join(row_repr))
         return "\n".join(lines)
 
     @property
     def has_bingo(self) -> bool:
         """Whether the current marked set contains a winning line."""
-        # Rows
-        for r in range(self.n):
-            if all((r, c) in self.marked for c in range(self.n)):
-                return True
-        # Columns
-        for c in range(self.n):
-            if all((r, c) in self.marked for r in range(self.n)):
-                return True
-        # Diagonals
-        if all((i, i) in self.marked for i in range(self.n)):
-            return True
-        if all((i, self.n - 1 - i) in self.marked for i in range(self.n)):
-            return True
-        return False
+        return self._won
@@ -1,5 +1,9 @@
 #!/usr/bin/env python3
-import random
+from __future__ import annotations
+
+from array import array
+
+import numpy as np
 
 
 class NumberDrawer:
@@ -24,41 +28,57 @@ class NumberDrawer:
             raise ValueError("pool_max must be at least 1.")
 
         self.pool_max = pool_max
-        self._pile: list[int] = []
+        self._pile: array[int] = array("i")
+        self._shuffled = False
         self.drawn: list[int] = []
-        self._rng = random.Random(seed)
+        self._rng = np.random.default_rng(seed)
         self._seed = seed
         self.reset()
 
     def reset(self, *, seed: int | None = None) -> None:
         """Reset the draw pile to its initial state.
 
-        This recreates the list from 1 to ``pool_max`` and shuffles it.
+        The permutation of 1 to ``pool_max`` is not built here; it is deferred to
+        the first :meth:`draw`, so resets that are never drawn from cost nothing.
         If a seed is provided, the internal RNG is reseeded for deterministic behavior.
 
         Args:
             seed (Optional[int]): A new seed to override the current one.
         """
         if seed is not None:
-            self._rng.seed(seed)
+            self._rng = np.random.default_rng(seed)
             self._seed = seed
 
-        self._pile = list(range(1, self.pool_max + 1))
-        self._rng.shuffle(self._pile)
+        self._pile = array("i")
+        self._shuffled = False
         self.drawn.clear()
 
+    def _shuffle(self) -> None:
+        """Build the draw pile from a fresh permutation of 1 to ``pool_max``.
+
+        NumPy's generator shuffles a compact ``int32`` array at C level and the
+        result is kept as a contiguous ``array('i')`` pile; popping from it still
+        yields plain ints.
+        """
+        self._pile = array("i", self._rng.permutation(np.arange(1, self.pool_max + 1, dtype=np.intc)).tobytes())
+        self._shuffled = True
+
     def draw(self) -> int | None:
         """Draw the next number from the pool.
 
+        The pile is a shuffled permutation, so every pop is unique and no
+        membership check against ``drawn`` is needed.
+
         Returns:
             Optional[int]: The drawn number, or ``None`` if no numbers remain.
         """
-        while self._pile:
-            x = self._pile.pop()
-            if x not in self.drawn:
-                self.drawn.append(x)
-                return x
-        return None
+        if not self._shuffled:
+            self._shuffle()
+        if not self._pile:
+            return None
+        x = self._pile.pop()
+        self.drawn.append(x)
+        return x
 
     def remaining(self) -> int:
         """Return the number of undrawn numbers remaining in the pool.
@@ -66,4 +86,4 @@ class NumberDrawer:
         Returns:
             int: Count of numbers still available to draw.
         """
-        return len(self._pile)
+        return len(self._pile) if self._shuffled else self.pool_max
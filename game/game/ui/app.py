@@ -3,16 +3,28 @@
 
 from __future__ import annotations
 
+from collections import deque
+from typing import TYPE_CHECKING
+
+import numpy as np
 import pandas as pd
 import streamlit as st
 
-from game.clients.persistence_client import PersistenceClient
 from game.core.bingo_card import BingoCard
 from game.core.number_drawer import NumberDrawer
+from game.ui.render import card_html
+
+if TYPE_CHECKING:
+    from game.clients.persistence_client import PersistenceClient
 
 DEFAULT_POOL_BY_SIZE = {3: 30, 4: 60, 5: 75}
+BOARD_SIZE_OPTIONS = (3, 4, 5)
+BOARD_SIZE_INDEX = {size: idx for idx, size in enumerate(BOARD_SIZE_OPTIONS)}
 ANALYTICS_HISTORY_LIMIT = 200
 DEFAULT_PLAYER_NAMES = ["Player 1", "Player 2"]
+REMOTE_CACHE_TTL_SECONDS = 30
+RECENT_DRAWS_SHOWN = 15
+LEADERBOARD_COLUMNS = {"name": "Player", "games_played": "Games", "wins": "Wins", "win_rate": "Win rate"}
 
 
 def _default_pool_max(board_size: int) -> int:
@@ -27,6 +39,76 @@ def _default_pool_max(board_size: int) -> int:
     return DEFAULT_POOL_BY_SIZE.get(board_size, board_size * board_size)
 
 
+def _requested_players(multiplayer: bool, player1_name: str, player2_name: str) -> list[str]:
+    """Return the player names the sidebar currently asks for.
+
+    Args:
+        multiplayer (bool): Whether the second player is enabled.
+        player1_name (str): Name entered for player 1.
+        player2_name (str): Name entered for player 2.
+
+    Returns:
+        list[str]: One name per active player.
+    """
+    return [player1_name, player2_name] if multiplayer else [player1_name]
+
+
+@st.cache_resource
+def _get_client() -> PersistenceClient:
+    """Return the process-wide persistence client.
+
+    Cached with ``st.cache_resource`` so its HTTP session (and connection pool)
+    survives across Streamlit reruns instead of being rebuilt per action.
+
+    Returns:
+        PersistenceClient: Shared client for the persistence service.
+    """
+    # Imported here so ``requests`` is only loaded once a remote call is needed.
+    from game.clients.persistence_client import PersistenceClient
+
+    return PersistenceClient()
+
+
+@st.cache_data(ttl=REMOTE_CACHE_TTL_SECONDS, show_spinner=False)
+def _cached_leaderboard(limit: int) -> pd.DataFrame:
+    """Fetch the leaderboard as a display-ready frame, memoized across reruns and sessions.
+
+    Rows are held column-wise and sorted and formatted once per cache miss, so
+    the render path hands the cached frame straight to ``st.dataframe``.
+
+    Args:
+        limit (int): Maximum number of rows to fetch.
+
+    Returns:
+        pd.DataFrame: Player, Games, Wins and formatted Win rate columns, best rate first.
+    """
+    rows = _get_client().fetch_leaderboard(limit=limit)
+    df = pd.DataFrame(rows, columns=list(LEADERBOARD_COLUMNS))
+    df["win_rate"] = df["win_rate"].astype(float)
+    df = df.sort_values("win_rate", ascending=False, kind="stable", ignore_index=True)
+    df["win_rate"] = (df["win_rate"] * 100).map("{:.1f}%".format)
+    return df.rename(columns=LEADERBOARD_COLUMNS)
+
+
+@st.cache_data(ttl=REMOTE_CACHE_TTL_SECONDS, show_spinner=False)
+def _cached_history(limit: int) -> list[dict]:
+    """Fetch game history rows, memoized across reruns and sessions.
+
+    Args:
+        limit (int): Maximum number of rows to fetch.
+
+    Returns:
+        list[dict]: History rows, newest first.
+    """
+    return _get_client().fetch_history(limit=limit)
+
+
+def _invalidate_remote_caches() -> None:
+    """Drop cached leaderboard/history data after a successful write."""
+    _cached_leaderboard.clear()
+    _cached_history.clear()
+
+
 def _reset_game(board_size: int, pool_max: int, free_center: bool, player_names: list[str] | None = None) -> None:
     """Initialize session state for a new game.
 
@@ -46,9 +128,12 @@ def _reset_game(board_size: int, pool_max: int, free_center: bool, player_names:
         )
         for _ in st.session_state.player_names
     ]
+    st.session_state.card_grids = np.stack([card.grid_array for card in st.session_state.cards])
     st.session_state.drawer = NumberDrawer(pool_max=pool_max)
     st.session_state.last_draw: int | None = None
     st.session_state.draw_history: list[int] = []
+    st.session_state.recent_draws: deque[int] = deque(maxlen=RECENT_DRAWS_SHOWN)
+    st.session_state.draw_history_tail_str = ""
     st.session_state.last_saved_result_map = {}
     st.session_state.config = {
         "board_size": board_size,
@@ -66,6 +151,8 @@ def _ensure_game() -> None:
     Initializes a default game configuration if no game state exists.
     Uses a 5×5 board with default pool size and no free center.
     """
+    if "last_saved_result_map" not in st.session_state:
+        st.session_state.last_saved_result_map = {}
     if "cards" in st.session_state and "drawer" in st.session_state:
         return
     default_size = 5
@@ -87,10 +174,28 @@ def _draw_number() -> tuple[int | None, dict[int, bool]]:
     if num is None:
         return None, {}
     st.session_state.draw_history.append(num)
-    hits: dict[int, bool] = {}
-    for idx, card in enumerate(cards):
-        hits[idx] = card.auto_mark_if_present(num)
-    return num, hits
+    recent = st.session_state.recent_draws
+    recent.append(num)  # bounded deque drops the oldest entry itself
+    st.session_state.draw_history_tail_str = ", ".join(map(str, recent))
+    return num, _auto_mark_all(st.session_state.card_grids, cards, num)
+
+
+def _auto_mark_all(grids: np.ndarray, cards: list[BingoCard], num: int) -> dict[int, bool]:
+    """Mark ``num`` on every card with one vectorized scan over the stacked grids.
+
+    Args:
+        grids (np.ndarray): ``(players, n, n)`` stack of the cards' grids.
+        cards (list[BingoCard]): Cards in the same order as ``grids``.
+        num (int): The number just drawn.
+
+    Returns:
+        dict[int, bool]: Per-player hit map.
+    """
+    hits = dict.fromkeys(range(len(cards)), False)
+    for idx, r, c in np.argwhere(grids == num).tolist():
+        cards[idx].mark(r, c)
+        hits[idx] = True
+    return hits
 
 
 def _render_card(card: BingoCard, title: str) -> None:
@@ -100,16 +205,9 @@ def _render_card(card: BingoCard, title: str) -> None:
         card (BingoCard): Card to render.
         title (str): Section title shown above the grid.
     """
-    center = (card.n // 2, card.n // 2) if (card.n % 2 == 1 and card.free_center) else None
-
     st.subheader(title)
-    for r in range(card.n):
-        cols = st.columns(card.n, gap="small")
-        for c in range(card.n):
-            value = "FREE" if center == (r, c) else str(card.grid[r][c])
-            marked = (r, c) in card.marked
-            label = f"{'✅' if marked else '⬜️'} {value}"
-            cols[c].write(label)
+    # One markdown element per card instead of N² column writes.
+    st.markdown(card_html(card.n, card.str_grid, card.marked_mask), unsafe_allow_html=True)
 
 
 def _save_result_for(player_name: str, card: BingoCard, won: bool) -> None:
@@ -120,15 +218,14 @@ def _save_result_for(player_name: str, card: BingoCard, won: bool) -> None:
         card (BingoCard): Player's card used for the game.
         won (bool): True if the player won; False otherwise.
     """
-    client = PersistenceClient()
     draws_count = len(st.session_state.draw_history)
-    signature = (player_name, won, card.n, card.pool_max, draws_count)
-    cache = st.session_state.get("last_saved_result_map", {})
+    cache = st.session_state.last_saved_result_map
+    signature = (won, card.n, card.pool_max, draws_count)
     if cache.get(player_name) == signature:
         return
 
     try:
-        client.record_result(
+        _get_client().record_result(
             player_name=player_name,
             board_size=card.n,
             pool_max=card.pool_max,
@@ -140,9 +237,7 @@ def _save_result_for(player_name: str, card: BingoCard, won: bool) -> None:
         return
 
     cache[player_name] = signature
-    st.session_state.last_saved_result_map = cache
-    st.session_state.leaderboard_cache = None
-    st.session_state.history_cache = None
+    _invalidate_remote_caches()
 
 
 def _load_history(limit: int = ANALYTICS_HISTORY_LIMIT) -> list[dict]:
@@ -154,24 +249,20 @@ def _load_history(limit: int = ANALYTICS_HISTORY_LIMIT) -> list[dict]:
     Returns:
         list[dict]: History rows, newest first (may be empty on error).
     """
-    cached = st.session_state.get("history_cache")
-    if cached is not None:
-        return cached
-
-    client = PersistenceClient()
     try:
-        history_rows = client.fetch_history(limit=limit)
-        st.session_state.history_cache = history_rows
-        return history_rows
+        return _cached_history(limit)
     except Exception as exc:  # noqa: BLE001 - surface to user
         st.error(f"Could not load history from persistence service: {exc}")
-        st.session_state.history_cache = []
         return []
 
 
+@st.cache_data(show_spinner=False)
 def _history_dataframe(history_rows: list[dict]) -> pd.DataFrame | None:
     """Convert history rows to a cleaned dataframe.
 
+    Memoized on the row contents, so the frame is only rebuilt when the
+    fetched history actually changes.
+
     Args:
         history_rows (list[dict]): Raw history entries from the API.
 
@@ -180,14 +271,42 @@ def _history_dataframe(history_rows: list[dict]) -> pd.DataFrame | None:
     """
     if not history_rows:
         return None
-    df = pd.DataFrame(history_rows)
-    if df.empty:
-        return None
-    df["played_at"] = pd.to_datetime(df["played_at"], errors="coerce")
+    count = len(history_rows)
+    # Build pre-typed columns so pandas skips per-row dtype inference.
+    df = pd.DataFrame(
+        {
+            "id": np.fromiter((row["id"] for row in history_rows), dtype=np.int64, count=count),
+            "name": [row["name"] for row in history_rows],
+            "board_size": np.fromiter((row["board_size"] for row in history_rows), dtype=np.int32, count=count),
+            "pool_max": np.fromiter((row["pool_max"] for row in history_rows), dtype=np.int32, count=count),
+            "won": np.fromiter((row["won"] for row in history_rows), dtype=bool, count=count),
+            "draws_count": np.fromiter((row["draws_count"] for row in history_rows), dtype=np.int32, count=count),
+            "played_at": pd.to_datetime(
+                [row["played_at"] for row in history_rows], format="ISO8601", errors="coerce", cache=True
+            ),
+        }
+    )
     df["played_date"] = df["played_at"].dt.date
     return df
 
 
+def _draw_histogram(draws: np.ndarray) -> pd.Series:
+    """Count games per draws-to-finish value.
+
+    ``draws_count`` is a small bounded integer, so one ``np.bincount`` pass
+    replaces hashing and sorting through ``value_counts``.
+
+    Args:
+        draws (np.ndarray): Non-negative draw counts, one per game.
+
+    Returns:
+        pd.Series: Game counts indexed by draw count, ascending, zeros dropped.
+    """
+    counts = np.bincount(draws)
+    present = np.flatnonzero(counts)
+    return pd.Series(counts[present], index=present, name="Games")
+
+
 def _compute_streaks(wins: pd.Series) -> tuple[int, int]:
     """Compute longest win and loss streaks for a player's ordered results.
 
@@ -197,18 +316,17 @@ def _compute_streaks(wins: pd.Series) -> tuple[int, int]:
     Returns:
         tuple[int, int]: (longest_win_streak, longest_loss_streak).
     """
-    longest_win = longest_loss = 0
-    current_win = current_loss = 0
-    for won in wins:
-        if bool(won):
-            current_win += 1
-            current_loss = 0
-        else:
-            current_loss += 1
-            current_win = 0
-        longest_win = max(longest_win, current_win)
-        longest_loss = max(longest_loss, current_loss)
-    return longest_win, longest_loss
+    won = wins.to_numpy(dtype=bool)
+    if won.size == 0:
+        return 0, 0
+    # Run-length encode: a run starts wherever the outcome differs from the previous game.
+    run_start = np.empty(won.size, dtype=bool)
+    run_start[0] = True
+    run_start[1:] = won[1:] != won[:-1]
+    starts = np.flatnonzero(run_start)
+    lengths = np.diff(np.append(starts, won.size))
+    run_won = won[starts]
+    return int(lengths[run_won].max(initial=0)), int(lengths[~run_won].max(initial=0))
 
 
 def _render_analytics_tab() -> None:
@@ -244,21 +362,29 @@ def _render_analytics_tab() -> None:
 
     st.divider()
 
+    # Per-board-size aggregates in one grouped pass (feeds efficiency + difficulty)
+    size_stats = df.groupby("board_size").agg(
+        avg_draws=("draws_count", "mean"),
+        best=("draws_count", "min"),
+        worst=("draws_count", "max"),
+        win_rate=("won", "mean"),
+    )
+
     # Draw efficiency
     st.markdown("##### Draw efficiency")
-    efficiency = df.groupby("board_size")["draws_count"].agg(["mean", "min", "max"]).round(2)
     st.dataframe(
-        efficiency.rename(columns={"mean": "avg_draws", "min": "best", "max": "worst"}),
+        size_stats[["avg_draws", "best", "worst"]],
         width="stretch",
+        column_config={"avg_draws": st.column_config.NumberColumn(format="%.2f")},
     )
-    draw_hist = df["draws_count"].value_counts().sort_index()
+    draw_hist = _draw_histogram(df["draws_count"].to_numpy())
     st.bar_chart(draw_hist, y_label="Games", x_label="Draws to finish")
 
     st.divider()
 
     # Board difficulty
     st.markdown("##### Board size difficulty")
-    win_rate_by_size = df.groupby("board_size")["won"].mean().mul(100).sort_index()
+    win_rate_by_size = size_stats["win_rate"].mul(100)
     st.bar_chart(win_rate_by_size, y_label="Win rate (%)", x_label="Board size")
 
     st.divider()
@@ -293,14 +419,9 @@ def _render_analytics_tab() -> None:
     )
 
     # Streaks per player (ordered by played_at)
-    streak_win = {}
-    streak_loss = {}
-    for name, group in df.sort_values("played_at").groupby("name"):
-        win_streak, loss_streak = _compute_streaks(group["won"])
-        streak_win[name] = win_streak
-        streak_loss[name] = loss_streak
-    player_stats["longest_win_streak"] = pd.Series(streak_win)
-    player_stats["longest_loss_streak"] = pd.Series(streak_loss)
+    streaks = df.sort_values(["played_at", "id"]).groupby("name")["won"].agg(_compute_streaks)
+    player_stats["longest_win_streak"] = streaks.str[0]
+    player_stats["longest_loss_streak"] = streaks.str[1]
 
     player_stats = player_stats.reset_index().rename(columns={"name": "player"})
     player_stats["avg_draws"] = player_stats["avg_draws"].round(1)
@@ -317,17 +438,68 @@ def _render_analytics_tab() -> None:
 
 
 def _record_multiplayer_results(winner_index: int) -> None:
-    """Save results for all players, marking only one winner.
+    """Save results for all players in one batched request, marking only one winner.
 
     Args:
         winner_index (int): Index of the winning player in session_state.cards.
     """
     if st.session_state.get("winner_recorded"):
         return
+    draws_count = len(st.session_state.draw_history)
+    cache = st.session_state.last_saved_result_map
+    rows = []
     for idx, card in enumerate(st.session_state.cards):
         name = st.session_state.player_names[idx]
-        _save_result_for(name, card, won=idx == winner_index)
+        won = idx == winner_index
+        if cache.get(name) == (won, card.n, card.pool_max, draws_count):
+            continue
+        rows.append(
+            {
+                "player_name": name,
+                "board_size": card.n,
+                "pool_max": card.pool_max,
+                "won": won,
+                "draws_count": draws_count,
+            }
+        )
     st.session_state.winner_recorded = True
+    if not rows:
+        return
+
+    try:
+        _get_client().record_results(rows)
+    except Exception as exc:  # noqa: BLE001 - surface to user
+        st.error(f"Could not save results via persistence service: {exc}")
+        return
+
+    for row in rows:
+        cache[row["player_name"]] = (row["won"], row["board_size"], row["pool_max"], row["draws_count"])
+    _invalidate_remote_caches()
+
+
+@st.fragment
+def _render_leaderboard() -> None:
+    """Render the leaderboard section.
+
+    Runs as a Streamlit fragment so pressing "Refresh leaderboard" only reruns
+    this section instead of the whole page (cards, metrics, sidebar).
+    """
+    st.subheader("Leaderboard")
+    refresh_requested = st.button("Refresh leaderboard", width="content")
+    if refresh_requested:
+        _cached_leaderboard.clear()
+    try:
+        leaderboard = _cached_leaderboard(limit=10)
+        if refresh_requested:
+            st.success("Leaderboard refreshed!")
+    except Exception as exc:  # noqa: BLE001 - surface to user
+        st.error(f"Could not load leaderboard from persistence service: {exc}")
+        leaderboard = None
+
+    if leaderboard is not None and not leaderboard.empty:
+        st.dataframe(leaderboard, hide_index=True)
+    else:
+        st.write("No games recorded yet.")
 
 
 def _render_gameplay(cards: list[BingoCard], drawer: NumberDrawer) -> None:
@@ -348,50 +520,54 @@ def _render_gameplay(cards: list[BingoCard], drawer: NumberDrawer) -> None:
             value=prev_multiplayer,
             help="Two local players share the draw pool.",
         )
-        board_size = st.selectbox(
-            "Board size (N×N)",
-            options=[3, 4, 5],
-            index=[3, 4, 5].index(st.session_state.config.get("board_size", 5)),
-        )
-        pool_default = _default_pool_max(board_size)
         current_config = st.session_state.config
-        pool_seed = current_config["pool_max"] if current_config.get("board_size") == board_size else pool_default
-        pool_max = st.number_input(
-            "Max number in pool",
-            min_value=board_size * board_size,
-            max_value=500,
-            value=int(pool_seed),
-            step=1,
-            help="Numbers are drawn from 1 up to this value with no repeats.",
-        )
-        free_center = st.checkbox(
-            "Free center (odd boards only)",
-            value=bool(current_config.get("free_center", False) and board_size % 2 == 1),
-            disabled=board_size % 2 == 0,
-        )
-        st.text_input(
-            "Player 1 name",
-            key="player1_name",
-            help="Name saved to the leaderboard when recording results.",
-        )
-        if enable_multiplayer:
+        # Setup widgets live in a form: editing them does not rerun the script
+        # (and refetch remote data) until "New game / reset" is submitted.
+        with st.form("setup", border=False):
+            board_size = st.selectbox(
+                "Board size (N×N)",
+                options=BOARD_SIZE_OPTIONS,
+                index=BOARD_SIZE_INDEX[current_config.get("board_size", 5)],
+            )
+            pool_max = st.number_input(
+                "Max number in pool",
+                min_value=BOARD_SIZE_OPTIONS[0] ** 2,
+                max_value=500,
+                value=int(current_config.get("pool_max", _default_pool_max(board_size))),
+                step=1,
+                help="Numbers are drawn from 1 up to this value with no repeats (at least N×N).",
+            )
+            free_center = st.checkbox(
+                "Free center (odd boards only)",
+                value=bool(current_config.get("free_center", False)),
+            )
             st.text_input(
-                "Player 2 name",
-                key="player2_name",
-                help="Second player sharing the draw pool.",
+                "Player 1 name",
+                key="player1_name",
+                help="Name saved to the leaderboard when recording results.",
             )
-        requested_players = (
-            [st.session_state.get("player1_name", DEFAULT_PLAYER_NAMES[0])]
-            if not enable_multiplayer
-            else [
-                st.session_state.get("player1_name", DEFAULT_PLAYER_NAMES[0]),
-                st.session_state.get("player2_name", DEFAULT_PLAYER_NAMES[1]),
-            ]
+            if enable_multiplayer:
+                st.text_input(
+                    "Player 2 name",
+                    key="player2_name",
+                    help="Second player sharing the draw pool.",
+                )
+            submitted = st.form_submit_button("New game / reset", width="stretch")
+        # Widgets in a form cannot react to each other before submit, so
+        # board-dependent settings are reconciled here instead.
+        if board_size != current_config.get("board_size") and pool_max == current_config.get("pool_max"):
+            pool_max = _default_pool_max(board_size)
+        pool_max = max(int(pool_max), board_size * board_size)
+        free_center = bool(free_center) and board_size % 2 == 1
+        requested_players = _requested_players(
+            enable_multiplayer,
+            st.session_state.get("player1_name", DEFAULT_PLAYER_NAMES[0]),
+            st.session_state.get("player2_name", DEFAULT_PLAYER_NAMES[1]),
         )
         if enable_multiplayer != prev_multiplayer:
             _reset_game(board_size, pool_max, free_center, player_names=requested_players)
             st.success("Multiplayer setting applied. New cards ready.")
-        if st.button("New game / reset", width="stretch"):
+        if submitted:
             _reset_game(board_size, pool_max, free_center, player_names=requested_players)
             st.success("New card ready!")
 
@@ -455,48 +631,11 @@ def _render_gameplay(cards: list[BingoCard], drawer: NumberDrawer) -> None:
     for idx, card in enumerate(cards):
         _render_card(card, f"{st.session_state.player_names[idx]}'s card")
 
-    st.subheader("Leaderboard")
-    if "leaderboard_cache" not in st.session_state or st.session_state.leaderboard_cache is None:
-        client = PersistenceClient()
-        try:
-            leaderboard_rows = client.fetch_leaderboard(limit=10)
-            st.session_state.leaderboard_cache = leaderboard_rows
-        except Exception as exc:  # noqa: BLE001 - surface to user
-            st.error(f"Could not load leaderboard from persistence service: {exc}")
-            st.session_state.leaderboard_cache = []
-            leaderboard_rows = []
-    else:
-        leaderboard_rows = st.session_state.leaderboard_cache
-
-    if st.button("Refresh leaderboard", width="content"):
-        client = PersistenceClient()
-        try:
-            leaderboard_rows = client.fetch_leaderboard(limit=10)
-            st.session_state.leaderboard_cache = leaderboard_rows
-            st.success("Leaderboard refreshed!")
-        except Exception as exc:  # noqa: BLE001 - surface to user
-            st.error(f"Could not load leaderboard from persistence service: {exc}")
-            leaderboard_rows = st.session_state.leaderboard_cache
-
-    if leaderboard_rows:
-        sorted_rows = sorted(leaderboard_rows, key=lambda r: float(r["win_rate"]), reverse=True)
-        display_rows = [
-            {
-                "Player": row["name"],
-                "Games": row["games_played"],
-                "Wins": row["wins"],
-                "Win rate": f"{float(row['win_rate']) * 100:.1f}%",
-            }
-            for row in sorted_rows
-        ]
-        st.dataframe(display_rows, hide_index=True)
-    else:
-        st.write("No games recorded yet.")
+    _render_leaderboard()
 
     st.subheader("Draw history")
     if st.session_state.draw_history:
-        recent = ", ".join(map(str, st.session_state.draw_history[-15:]))
-        st.write(f"Recent draws ({len(st.session_state.draw_history)} total): {recent}")
+        st.write(f"Recent draws ({len(st.session_state.draw_history)} total): {st.session_state.draw_history_tail_str}")
     else:
         st.write("No numbers drawn yet.")
 
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""HTML rendering helpers for the Streamlit interface.
+
+Kept out of ``app.py`` on purpose: ``streamlit run`` re-executes the entry
+script as a fresh ``__main__`` module on every rerun, which would discard any
+``lru_cache`` defined there. Imported modules stay loaded, so the memo below
+is shared by every rerun and session in the process.
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=64)
+def card_html(n: int, labels: tuple[tuple[str, ...], ...], marked_mask: int) -> str:
+    """Build the HTML table for a card state.
+
+    Memoized on the card contents, so reruns without a new mark reuse the string.
+
+    Args:
+        n (int): Board dimension.
+        labels (tuple[tuple[str, ...], ...]): Cell labels row by row (``card.str_grid``).
+        marked_mask (int): Marked cells, bit ``r*n + c`` per cell (``card.marked_mask``).
+
+    Returns:
+        str: A ``<table>`` with one ``<td>`` per cell.
+    """
+    rows_html = []
+    for r in range(n):
+        cells = []
+        row = labels[r]
+        row_bits = marked_mask >> (r * n)
+        for c in range(n):
+            if row_bits >> c & 1:
+                cells.append(f'<td class="marked">✅ {row[c]}</td>')
+            else:
+                cells.append(f'<td class="open">⬜️ {row[c]}</td>')
+        rows_html.append(f"<tr>{''.join(cells)}</tr>")
+    return f"<table>{''.join(rows_html)}</table>"
@@ -1,7 +1,28 @@
 #!/usr/bin/env python3
 """Unit tests for Streamlit app utility functions."""
 
-from game.ui.app import DEFAULT_POOL_BY_SIZE, _default_pool_max
+import importlib
+import os
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
+
+from game.core.bingo_card import BingoCard
+from game.ui.app import (
+    BOARD_SIZE_INDEX,
+    BOARD_SIZE_OPTIONS,
+    DEFAULT_POOL_BY_SIZE,
+    _auto_mark_all,
+    _cached_leaderboard,
+    _compute_streaks,
+    _default_pool_max,
+    _draw_histogram,
+    _get_client,
+    _history_dataframe,
+    _requested_players,
+)
+from game.ui.render import card_html
 
 
 def test_default_pool_max():
@@ -11,3 +32,120 @@ def test_default_pool_max():
     assert _default_pool_max(5) == 75
     assert _default_pool_max(6) == 36  # Fallback for unsupported sizes
     assert DEFAULT_POOL_BY_SIZE == {3: 30, 4: 60, 5: 75}
+
+
+def test_board_size_index_matches_options():
+    """Test that the selectbox index lookup agrees with the option order."""
+    assert all(BOARD_SIZE_OPTIONS[BOARD_SIZE_INDEX[size]] == size for size in BOARD_SIZE_OPTIONS)
+
+
+def test_requested_players():
+    """Test that only player 1 is requested unless multiplayer is enabled."""
+    assert _requested_players(False, "Ann", "Bob") == ["Ann"]
+    assert _requested_players(True, "Ann", "Bob") == ["Ann", "Bob"]
+
+
+def test_compute_streaks():
+    """Test longest win/loss streak detection on ordered results."""
+    assert _compute_streaks(pd.Series([True, True, False, True, True, True, False, False])) == (3, 2)
+    assert _compute_streaks(pd.Series([1, 1, 1])) == (3, 0)
+    assert _compute_streaks(pd.Series([False])) == (0, 1)
+    assert _compute_streaks(pd.Series([], dtype=bool)) == (0, 0)
+
+
+def test_draw_histogram_matches_value_counts():
+    """Test that the bincount histogram matches pandas value_counts ordering and counts."""
+    draws = pd.Series([12, 7, 12, 30, 7, 12], dtype="int32")
+    hist = _draw_histogram(draws.to_numpy())
+    expected = draws.value_counts().sort_index()
+    assert hist.index.tolist() == expected.index.tolist()
+    assert hist.tolist() == expected.tolist()
+
+
+def test_card_html_marks_and_free_center():
+    """Test that card HTML has one cell per number and flags marked/free cells."""
+    card = BingoCard(n=3, pool_max=30, free_center=True, seed=4)
+    card.mark(0, 0)
+    html = card_html(card.n, card.str_grid, card.marked_mask)
+    assert html.count("<td") == 9
+    assert html.count('class="marked"') == 2
+    assert "FREE" in html
+    assert card_html(card.n, card.str_grid, card.marked_mask) is html  # memoized
+    assert '<td class="marked">✅ FREE</td>' in html
+
+
+def test_card_html_cache_survives_app_rerun():
+    """Test that re-executing the app script keeps the mask-keyed card HTML memo."""
+    import game.ui.app as app
+
+    card = BingoCard(n=4, pool_max=60, seed=8)
+    card.mark(1, 1)
+    html = card_html(card.n, card.str_grid, card.marked_mask)
+    info = card_html.cache_info()
+
+    app = importlib.reload(app)  # what ``streamlit run`` does on every rerun
+    assert app.card_html(card.n, card.str_grid, card.marked_mask) is html
+    assert card_html.cache_info().hits == info.hits + 1
+
+    card.mark(2, 3)  # a new mark changes the key and renders once
+    assert app.card_html(card.n, card.str_grid, card.marked_mask).count('class="marked"') == 2
+    assert card_html.cache_info().misses == info.misses + 1
+
+
+def test_history_dataframe_types():
+    """Test that history rows become a typed dataframe with parsed timestamps."""
+    rows = [
+        {"id": 2, "name": "Bob", "board_size": 3, "pool_max": 30, "won": False, "draws_count": 9, "played_at": "2025-01-02 10:00:00"},
+        {"id": 1, "name": "Ann", "board_size": 5, "pool_max": 75, "won": True, "draws_count": 20, "played_at": "2025-01-01T09:30:00"},
+    ]
+    df = _history_dataframe(rows)
+    assert list(df["name"]) == ["Bob", "Ann"]
+    assert df["won"].dtype == bool
+    assert pd.api.types.is_datetime64_any_dtype(df["played_at"])
+    assert str(df["played_date"].iloc[1]) == "2025-01-01"
+    assert _history_dataframe([]) is None
+
+
+def test_cached_leaderboard_sorts_and_formats_rows():
+    """Test that the leaderboard frame is sorted by win rate and display-ready."""
+    client = Mock()
+    client.fetch_leaderboard.return_value = [
+        {"name": "Ann", "wins": 3, "games_played": 6, "win_rate": 0.5},
+        {"name": "Bob", "wins": 2, "games_played": 2, "win_rate": 1.0},
+    ]
+    _cached_leaderboard.clear()
+    with patch("game.ui.app._get_client", return_value=client):
+        board = _cached_leaderboard(limit=7)
+        client.fetch_leaderboard.return_value = []
+        empty = _cached_leaderboard(limit=3)
+    _cached_leaderboard.clear()
+
+    client.fetch_leaderboard.assert_any_call(limit=7)
+    assert board.to_dict("records") == [
+        {"Player": "Bob", "Games": 2, "Wins": 2, "Win rate": "100.0%"},
+        {"Player": "Ann", "Games": 6, "Wins": 3, "Win rate": "50.0%"},
+    ]
+    assert empty.empty and list(empty.columns) == ["Player", "Games", "Wins", "Win rate"]
+
+
+def test_get_client_is_shared_across_calls():
+    """Test that every call site reuses one client (and its connection pool)."""
+    _get_client.clear()
+    with patch.dict(os.environ, {"PERSISTENCE_URL": "http://localhost:8000"}):
+        first = _get_client()
+        second = _get_client()
+    _get_client.clear()
+    assert first is second
+
+
+def test_auto_mark_all_marks_every_card_holding_the_number():
+    """Test that the stacked-grid scan marks hits on each card and reports misses."""
+    cards = [BingoCard(n=3, pool_max=30, seed=1), BingoCard(n=3, pool_max=30, seed=2)]
+    grids = np.array([card.grid for card in cards], dtype=np.int32)
+    target = cards[0].grid[2][1]
+    hits = _auto_mark_all(grids, cards, target)
+
+    assert hits[0] is True
+    assert (2, 1) in cards[0].marked
+    assert hits[1] is (cards[1].find(target) is not None)
+    assert _auto_mark_all(grids, cards, 31) == {0: False, 1: False}
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Tests for the asyncio persistence client."""
+
+import asyncio
+import json
+import os
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from game.clients.async_persistence_client import AsyncPersistenceClient
+from game.clients.persistence_client import _POOL_MAXSIZE
+
+
+class TestAsyncPersistenceClient:
+    """Tests for the asyncio client against a stubbed transport."""
+
+    @staticmethod
+    def _client(handler):
+        return AsyncPersistenceClient(base_url="http://localhost:8000/", transport=httpx.MockTransport(handler))
+
+    def test_requires_url(self):
+        """Test that the async client resolves the URL like the sync client."""
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(RuntimeError, match="PERSISTENCE_URL is not set"):
+                AsyncPersistenceClient()
+
+    def test_concurrent_fetch_and_save(self):
+        """Test that a leaderboard fetch and a save can be awaited together."""
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append((request.method, request.url.path, request.url.params.get("limit")))
+            if request.method == "GET":
+                return httpx.Response(200, json=[{"name": "Alice", "wins": 1}])
+            assert json.loads(request.content)["player_name"] == "Alice"
+            return httpx.Response(201, json={"status": "ok"})
+
+        async def scenario():
+            async with self._client(handler) as client:
+                return await asyncio.gather(
+                    client.fetch_leaderboard(limit=5),
+                    client.record_result("Alice", 5, 75, True, 12),
+                )
+
+        leaderboard, saved = asyncio.run(scenario())
+        assert leaderboard == [{"name": "Alice", "wins": 1}]
+        assert saved is None
+        assert sorted(seen) == [("GET", "/leaderboard", "5"), ("POST", "/results", None)]
+
+    def test_record_results_falls_back_on_404(self):
+        """Test per-row fallback when the batch route is not available."""
+        paths = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            return httpx.Response(404 if request.url.path.endswith("/batch") else 201)
+
+        rows = [
+            {"player_name": "Alice", "board_size": 5, "pool_max": 75, "won": True, "draws_count": 12},
+            {"player_name": "Bob", "board_size": 5, "pool_max": 75, "won": False, "draws_count": 12},
+        ]
+
+        async def scenario():
+            async with self._client(handler) as client:
+                await client.record_results(rows)
+
+        asyncio.run(scenario())
+        assert paths == ["/results/batch", "/results", "/results"]
+
+    def test_record_results_empty_sends_nothing(self):
+        """Test that an empty batch returns without calling the service."""
+        paths = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            return httpx.Response(422)
+
+        async def scenario():
+            async with self._client(handler) as client:
+                await client.record_results([])
+
+        asyncio.run(scenario())
+        assert paths == []
+
+    def test_record_results_fallback_is_capped(self):
+        """Test that the 404 fallback never has more saves in flight than pooled connections."""
+        in_flight = peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            if request.url.path.endswith("/batch"):
+                return httpx.Response(404)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(201)
+
+        rows = [
+            {"player_name": f"P{i}", "board_size": 3, "pool_max": 30, "won": False, "draws_count": 9}
+            for i in range(20)
+        ]
+
+        async def scenario():
+            async with self._client(handler) as client:
+                await client.record_results(rows)
+
+        asyncio.run(scenario())
+        assert peak == _POOL_MAXSIZE
+
+    def test_fetch_history_error(self):
+        """Test that error responses surface as RuntimeError."""
+
+        async def scenario():
+            async with self._client(lambda request: httpx.Response(500, text="boom")) as client:
+                await client.fetch_history()
+
+        with pytest.raises(RuntimeError, match="Failed to fetch history: 500"):
+            asyncio.run(scenario())
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """Unit tests for BingoCard class."""
 
+import random
 import re
 
+import numpy as np
 import pytest
 
 from game.core.bingo_card import BingoCard
@@ -126,6 +128,16 @@ class TestBingoCardBasicFunctionality:
         assert "\n" in out
         assert re.search(r"\d", out) is not None
 
+    def test_render_colors_only_marked_cells(self):
+        """Ensures render() pads every cell equally and colors exactly the marked ones."""
+        card = BingoCard(n=3, pool_max=30, seed=4)
+        card.mark(1, 2)
+        out = card.render(lambda text, name=None: f"[{text}]" if name == "green" else text)
+        rows = out.splitlines()
+        assert rows[0] == "   " + " ".join(f"{c:>4}" for c in range(3))
+        assert rows[2] == f" 1 {card.grid[1][0]:>4} {card.grid[1][1]:>4} [{card.grid[1][2]:>4}]"
+        assert out.count("[") == 1
+
 
 class TestBingoCardAdvancedFeatures:
     """Tests for advanced BingoCard features like free center and bingo detection."""
@@ -137,7 +149,7 @@ class TestBingoCardAdvancedFeatures:
             - The center cell must always hold the value 0.
             - The center cell must always remain marked.
             - toggle_mark() must *not* unmark the center.
-            - render() should visually indicate the FREE space.
+            - render() and str_grid should visually indicate the FREE space.
         """
         card = BingoCard(n=5, pool_max=75, free_center=True, seed=123)
         center = card.n // 2
@@ -151,6 +163,8 @@ class TestBingoCardAdvancedFeatures:
 
         rendered = card.render()
         assert "FREE" in rendered
+        assert card.str_grid[center][center] == "FREE"
+        assert card.str_grid[0][0] == str(card.grid[0][0])
 
     def test_has_bingo_detects_all_patterns(self):
         """Tests that has_bingo() correctly detects all valid bingo patterns.
@@ -193,3 +207,140 @@ class TestBingoCardAdvancedFeatures:
         card = BingoCard(n=n, pool_max=75)
         card.marked = {(0, 0), (0, 1), (1, 1)}  # Not a full row, column, or diagonal
         assert card.has_bingo is False
+
+    def test_marked_mask_matches_marked_cells(self):
+        """Tests that the marked bitmask and the coordinate view stay in sync.
+
+        Validates that:
+            - Marking a cell sets bit r*N + c.
+            - Toggling the same cell clears it again.
+            - Every row, column and diagonal on 3, 4 and 5 boards wins, and nothing shorter does.
+        """
+        card = BingoCard(n=4, pool_max=60, seed=3)
+        card.mark(2, 1)
+        assert card.marked_mask == 1 << (2 * 4 + 1)
+        assert card.marked == {(2, 1)}
+        assert np.argwhere(card.marked_array).tolist() == [[2, 1]]
+        assert card.grid_array.tolist() == card.grid
+        card.toggle_mark(2, 1)
+        assert card.marked_mask == 0
+
+        for n in (3, 4, 5):
+            card = BingoCard(n=n, pool_max=75)
+            lines = (
+                [[(r, c) for c in range(n)] for r in range(n)]
+                + [[(r, c) for r in range(n)] for c in range(n)]
+                + [[(i, i) for i in range(n)], [(i, n - 1 - i) for i in range(n)]]
+            )
+            for line in lines:
+                card.marked = line
+                assert card.has_bingo is True
+                card.marked = line[:-1]
+                assert card.has_bingo is False
+
+    def test_find_uses_number_index(self):
+        """Tests that find() locates every card number and skips the free slot.
+
+        Validates that:
+            - Each grid number maps back to its own coordinates.
+            - The free-center sentinel (0) and off-card numbers are not found.
+        """
+        card = BingoCard(n=5, pool_max=75, free_center=True, seed=11)
+        for r in range(5):
+            for c in range(5):
+                if (r, c) != (2, 2):
+                    assert card.find(card.grid[r][c]) == (r, c)
+        assert card.find(0) is None
+        assert card.find(76) is None
+
+    def test_has_bingo_tracks_marks_and_unmarks(self):
+        """Tests that the incrementally tracked win state matches a full rescan.
+
+        Validates that:
+            - Completing a line sets has_bingo and un-toggling it clears it again.
+            - Random toggle sequences agree with checking every line from scratch.
+        """
+        n = 5
+        card = BingoCard(n=n, pool_max=75, seed=5)
+        for c in range(n):
+            card.toggle_mark(1, c)
+        assert card.has_bingo is True
+        card.toggle_mark(1, 3)
+        assert card.has_bingo is False
+
+        rng = random.Random(42)
+        card = BingoCard(n=n, pool_max=75, free_center=True, seed=6)
+        for _ in range(300):
+            card.toggle_mark(rng.randrange(n), rng.randrange(n))
+            marked = card.marked
+            lines = (
+                [[(r, c) for c in range(n)] for r in range(n)]
+                + [[(r, c) for r in range(n)] for c in range(n)]
+                + [[(i, i) for i in range(n)], [(i, n - 1 - i) for i in range(n)]]
+            )
+            assert card.has_bingo is any(all(cell in marked for cell in line) for line in lines)
+
+
+class TestBingoCardBatch:
+    """Tests for batched card generation and win checks."""
+
+    def test_generate_many_shapes_and_uniqueness(self):
+        """Tests that generate_many returns unique, in-range numbers per card.
+
+        Validates that:
+            - The batch has shape (count, n, n) and int32 dtype.
+            - Each card holds N*N distinct numbers in 1..pool_max.
+            - The same seed reproduces the batch; free_center zeroes the center.
+        """
+        grids = BingoCard.generate_many(200, 5, 75, seed=9)
+        assert grids.shape == (200, 5, 5)
+        assert grids.dtype == np.int32
+        flat = grids.reshape(200, 25)
+        assert flat.min() >= 1 and flat.max() <= 75
+        assert all(len(set(row.tolist())) == 25 for row in flat)
+        assert np.array_equal(grids, BingoCard.generate_many(200, 5, 75, seed=9))
+
+        free = BingoCard.generate_many(10, 3, 30, free_center=True, seed=1)
+        assert (free[:, 1, 1] == 0).all()
+
+        with pytest.raises(ValueError, match="pool_max must be at least N\\*N"):
+            BingoCard.generate_many(5, 5, 20)
+
+    def test_has_bingo_batch_matches_cards(self):
+        """Tests that the vectorized check agrees with BingoCard.has_bingo."""
+        rng = random.Random(3)
+        cards = []
+        for _ in range(200):
+            card = BingoCard(n=4, pool_max=60)
+            card.marked = {(rng.randrange(4), rng.randrange(4)) for _ in range(9)}
+            cards.append(card)
+        result = BingoCard.has_bingo_batch(np.array([card.marked_mask for card in cards]), 4)
+        assert result.tolist() == [card.has_bingo for card in cards]
+
+    def test_draws_to_bingo_matches_replay(self):
+        """Tests the vectorized draw count against replaying each game on a BingoCard.
+
+        Validates that:
+            - Marking numbers in draw order first wins at the reported draw.
+            - simulate_games is reproducible and bounded by the line length and pool size.
+        """
+        count, n, pool_max = 50, 5, 75
+        rng = np.random.default_rng(7)
+        grids = BingoCard.generate_many(count, n, pool_max, free_center=True, seed=7)
+        orders = np.argsort(rng.random((count, pool_max)), axis=1) + 1
+        result = BingoCard.draws_to_bingo(grids, orders)
+        for grid, order, expected in zip(grids, orders, result, strict=True):
+            card = BingoCard(n=n, pool_max=pool_max, free_center=True)  # only its marks are used
+            positions = {v: divmod(i, n) for i, v in enumerate(grid.ravel().tolist()) if v}
+            draws = 0
+            while not card.has_bingo:
+                number = int(order[draws])
+                draws += 1
+                if number in positions:
+                    card.mark(*positions[number])
+            assert draws == expected
+
+        sims = BingoCard.simulate_games(500, 3, 30, seed=2)
+        assert sims.shape == (500,)
+        assert sims.min() >= 3 and sims.max() <= 30
+        assert np.array_equal(sims, BingoCard.simulate_games(500, 3, 30, seed=2))
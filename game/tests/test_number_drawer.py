@@ -51,6 +51,15 @@ class TestNumberDrawerCoreFunctionality:
         assert len(draws) == 15
         assert drawer.remaining() == 0
 
+    def test_draws_plain_python_ints(self):
+        """Tests that drawn numbers are builtin ints, not NumPy scalars.
+
+        The pile is shuffled with NumPy, but values flow into session state,
+        JSON payloads, and UI labels, so they must stay plain ``int``.
+        """
+        drawer = NumberDrawer(pool_max=10, seed=7)
+        assert all(type(drawer.draw()) is int for _ in range(10))
+
     def test_reset_restores_full_pool(self):
         """Tests that reset() restores the drawer to a full fresh state.
 
@@ -105,3 +114,15 @@ class TestNumberDrawerDeterminism:
 
         assert new_draws_a == new_draws_b
         assert new_draws_a != draws_a[:5]
+
+    def test_reset_defers_shuffle_until_first_draw(self):
+        """Test that reset leaves the pile unbuilt while remaining() stays accurate."""
+        drawer = NumberDrawer(pool_max=30, seed=7)
+        drawer.reset()
+        drawer.reset()
+        assert drawer.remaining() == 30
+        assert len(drawer._pile) == 0
+
+        first = drawer.draw()
+        assert first is not None
+        assert drawer.remaining() == 29
@@ -2,6 +2,7 @@
 """Tests for the persistence client."""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import pytest
@@ -40,6 +41,24 @@ class TestPersistenceClientInitialization:
         client = PersistenceClient(base_url="http://localhost:8000", timeout=10)
         assert client.timeout == 10
 
+    def test_init_mounts_pooled_adapter(self):
+        """Test that the shared session mounts a retrying, pooled adapter."""
+        client = PersistenceClient(base_url="http://localhost:8000")
+        adapter = client._session.get_adapter("http://localhost:8000")
+        assert adapter.max_retries.total == 3
+        assert adapter.max_retries.read == 0
+        assert 503 in adapter.max_retries.status_forcelist
+        assert adapter.max_retries.allowed_methods == frozenset({"GET"})  # never replay a save
+        assert adapter.max_retries.raise_on_status is False
+        assert client._session.headers["Accept"] == "application/json"
+
+    def test_context_manager_closes_session(self):
+        """Test that exiting the context manager closes the HTTP session."""
+        with patch("game.clients.persistence_client.requests.Session.close") as mock_close:
+            with PersistenceClient(base_url="http://localhost:8000") as client:
+                assert isinstance(client, PersistenceClient)
+            mock_close.assert_called_once()
+
 
 class TestPersistenceClientLeaderboard:
     """Tests for leaderboard fetching functionality."""
@@ -49,7 +68,7 @@ class TestPersistenceClientLeaderboard:
         """Create a PersistenceClient instance for testing."""
         return PersistenceClient(base_url="http://localhost:8000")
 
-    @patch("game.clients.persistence_client.requests.get")
+    @patch("game.clients.persistence_client.requests.Session.get")
     def test_fetch_leaderboard_success(self, mock_get, client):
         """Test successful leaderboard fetch."""
         mock_response = Mock()
@@ -70,7 +89,7 @@ class TestPersistenceClientLeaderboard:
             timeout=5,
         )
 
-    @patch("game.clients.persistence_client.requests.get")
+    @patch("game.clients.persistence_client.requests.Session.get")
     def test_fetch_leaderboard_default_limit(self, mock_get, client):
         """Test leaderboard fetch with default limit."""
         mock_response = Mock()
@@ -86,7 +105,7 @@ class TestPersistenceClientLeaderboard:
             timeout=5,
         )
 
-    @patch("game.clients.persistence_client.requests.get")
+    @patch("game.clients.persistence_client.requests.Session.get")
     def test_fetch_leaderboard_error(self, mock_get, client):
         """Test leaderboard fetch with error response."""
         mock_response = Mock()
@@ -106,7 +125,7 @@ class TestPersistenceClientHistory:
         """Create a PersistenceClient instance for testing."""
         return PersistenceClient(base_url="http://localhost:8000")
 
-    @patch("game.clients.persistence_client.requests.get")
+    @patch("game.clients.persistence_client.requests.Session.get")
     def test_fetch_history_success(self, mock_get, client):
         """Test successful history fetch."""
         mock_response = Mock()
@@ -123,7 +142,7 @@ class TestPersistenceClientHistory:
             timeout=5,
         )
 
-    @patch("game.clients.persistence_client.requests.get")
+    @patch("game.clients.persistence_client.requests.Session.get")
     def test_fetch_history_error(self, mock_get, client):
         """Test history fetch with error response."""
         mock_response = Mock()
@@ -143,7 +162,7 @@ class TestPersistenceClientRecordResult:
         """Create a PersistenceClient instance for testing."""
         return PersistenceClient(base_url="http://localhost:8000")
 
-    @patch("game.clients.persistence_client.requests.post")
+    @patch("game.clients.persistence_client.requests.Session.post")
     def test_record_result_success(self, mock_post, client):
         """Test successful result recording."""
         mock_response = Mock()
@@ -170,7 +189,7 @@ class TestPersistenceClientRecordResult:
             timeout=5,
         )
 
-    @patch("game.clients.persistence_client.requests.post")
+    @patch("game.clients.persistence_client.requests.Session.post")
     def test_record_result_success_200(self, mock_post, client):
         """Test result recording with 200 status code (also acceptable)."""
         mock_response = Mock()
@@ -187,7 +206,7 @@ class TestPersistenceClientRecordResult:
 
         mock_post.assert_called_once()
 
-    @patch("game.clients.persistence_client.requests.post")
+    @patch("game.clients.persistence_client.requests.Session.post")
     def test_record_result_error(self, mock_post, client):
         """Test result recording with error response."""
         mock_response = Mock()
@@ -203,3 +222,78 @@ class TestPersistenceClientRecordResult:
                 won=True,
                 draws_count=10,
             )
+
+
+class TestPersistenceClientRecordResults:
+    """Tests for batched result recording."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a PersistenceClient instance for testing."""
+        return PersistenceClient(base_url="http://localhost:8000")
+
+    @pytest.fixture
+    def rows(self):
+        """Two result payloads for a multiplayer round."""
+        return [
+            {"player_name": "Alice", "board_size": 5, "pool_max": 75, "won": True, "draws_count": 12},
+            {"player_name": "Bob", "board_size": 5, "pool_max": 75, "won": False, "draws_count": 12},
+        ]
+
+    @patch("game.clients.persistence_client.requests.Session.post")
+    def test_record_results_single_request(self, mock_post, client, rows):
+        """Test that all rows are sent to the batch route in one call."""
+        mock_post.return_value = Mock(status_code=201)
+
+        client.record_results(rows)
+
+        mock_post.assert_called_once_with(
+            "http://localhost:8000/results/batch",
+            json={"results": rows},
+            timeout=5,
+        )
+
+    @patch("game.clients.persistence_client.requests.Session.post")
+    def test_record_results_falls_back_on_404(self, mock_post, client, rows):
+        """Test per-row fallback when the batch route is not available."""
+        mock_post.side_effect = lambda url, **_: Mock(status_code=404 if url.endswith("/batch") else 201)
+
+        client.record_results(rows)
+
+        assert mock_post.call_count == 3
+        fallback_calls = mock_post.call_args_list[1:]
+        assert {call.args[0] for call in fallback_calls} == {"http://localhost:8000/results"}
+        assert sorted(call.kwargs["json"]["player_name"] for call in fallback_calls) == ["Alice", "Bob"]
+
+    @patch("game.clients.persistence_client.requests.Session.post")
+    def test_record_results_empty_and_capped_fallback(self, mock_post, client):
+        """Test that empty batches send nothing and large fallbacks use a bounded pool."""
+        client.record_results([])
+        mock_post.assert_not_called()
+
+        mock_post.side_effect = lambda url, **_: Mock(status_code=404 if url.endswith("/batch") else 201)
+        many = [
+            {"player_name": f"P{i}", "board_size": 3, "pool_max": 30, "won": False, "draws_count": 9}
+            for i in range(20)
+        ]
+        with patch("game.clients.persistence_client.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as executor:
+            client.record_results(many)
+        executor.assert_called_once_with(max_workers=8)
+        assert mock_post.call_count == 21
+
+    @patch("game.clients.persistence_client.requests.Session.post")
+    def test_record_results_fallback_error(self, mock_post, client, rows):
+        """Test that a failing per-row fallback call surfaces as RuntimeError."""
+        mock_post.side_effect = lambda url, **_: Mock(status_code=404 if url.endswith("/batch") else 500, text="boom")
+
+        with pytest.raises(RuntimeError, match="Failed to save result: 500"):
+            client.record_results(rows)
+
+    @patch("game.clients.persistence_client.requests.Session.post")
+    def test_record_results_error(self, mock_post, client, rows):
+        """Test batched recording with error response."""
+        mock_post.return_value = Mock(status_code=500, text="Internal Server Error")
+
+        with pytest.raises(RuntimeError, match="Failed to save results: 500"):
+            client.record_results(rows)
+
@@ -3,12 +3,23 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
+from typing import Annotated
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, Response
 
-from persistence.api.models import GameHistoryEntry, GameResultRequest, StatusResponse
+from persistence.api.models import (
+    GameHistoryEntry,
+    GameResultBatchRequest,
+    GameResultRequest,
+    StatusResponse,
+)
 from persistence.core.repository import BingoRepository
 
 
@@ -18,7 +29,22 @@ def _db_path() -> str:
     Returns:
         str: Absolute database file path, or ":memory:" when requested.
     """
-    env_path = os.environ.get("BINGO_DB_PATH")
+    return _resolve_db_path(os.environ.get("BINGO_DB_PATH"))
+
+
+@lru_cache(maxsize=8)
+def _resolve_db_path(env_path: str | None) -> str:
+    """Canonicalize a ``BINGO_DB_PATH`` value once instead of on every request.
+
+    ``Path.resolve`` stats the filesystem, so results are cached per raw value;
+    changing the environment variable still takes effect on the next call.
+
+    Args:
+        env_path: Raw ``BINGO_DB_PATH`` value, or None when unset.
+
+    Returns:
+        str: Absolute database file path, or ":memory:" when requested.
+    """
     if env_path:
         if env_path == ":memory:":
             return ":memory:"
@@ -28,7 +54,46 @@ def _db_path() -> str:
     return str(default_path.resolve())
 
 
-app = FastAPI(title="Bingo Persistence API", version="0.1.0")
+_repositories: dict[str, BingoRepository] = {}
+_repositories_lock = threading.Lock()
+
+
+def _repository() -> BingoRepository:
+    """Return the shared repository for the configured database path.
+
+    The repository (and its SQLite connection) is opened once per path and
+    reused by every request instead of being opened and closed per call.
+
+    Returns:
+        BingoRepository: Repository bound to ``_db_path()``.
+    """
+    db_path = _db_path()
+    with _repositories_lock:
+        repo = _repositories.get(db_path)
+        if repo is None:
+            repo = _repositories[db_path] = BingoRepository(db_path)
+    return repo
+
+
+Repository = Annotated[BingoRepository, Depends(_repository)]
+
+# Upper bounds for the read endpoints so one request cannot ask for the whole table.
+MAX_LEADERBOARD_LIMIT = 100
+MAX_HISTORY_LIMIT = 1000
+
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Close shared repositories when the application shuts down."""
+    yield
+    with _repositories_lock:
+        for repo in _repositories.values():
+            repo.close()
+        _repositories.clear()
+
+
+app = FastAPI(title="Bingo Persistence API", version="0.1.0", lifespan=_lifespan)
+
 
 @app.get("/health", response_model=StatusResponse)
 def health_check() -> StatusResponse:
@@ -40,49 +105,83 @@ def health_check() -> StatusResponse:
     return StatusResponse(status="ok")
 
 
-@app.get("/leaderboard")
-def get_leaderboard(limit: int = 10) -> list[dict]:
+def _etag(rows: list[dict]) -> str:
+    """Build a strong ETag from the content of a response payload.
+
+    Hashing the rows (not a process-local write counter) keeps the tag valid
+    across restarts and across processes sharing the same database file.
+
+    Args:
+        rows: Rows that will be serialized into the response body.
+
+    Returns:
+        str: Quoted entity tag.
+    """
+    return '"' + hashlib.blake2b(repr(rows).encode(), digest_size=16).hexdigest() + '"'
+
+
+def _etag_matches(etag: str, if_none_match: str | None) -> bool:
+    """Check an ``If-None-Match`` header against an ETag using weak comparison."""
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+@app.get("/leaderboard", response_model=list[dict])
+def get_leaderboard(
+    repo: Repository,
+    response: Response,
+    limit: Annotated[int, Query(ge=1, le=MAX_LEADERBOARD_LIMIT)] = 10,
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> list[dict] | Response:
     """Return leaderboard entries.
 
+    Responses carry an ETag; a request whose ``If-None-Match`` still matches
+    gets an empty 304 instead of a re-serialized body.
+
     Args:
-        limit (int): Maximum number of entries to return (default 10).
+        repo (BingoRepository): Shared repository (injected).
+        response (Response): Outgoing response, used to attach the ETag header.
+        limit (int): Maximum number of entries to return (default 10, 1-100; other values get a 422).
+        if_none_match (Optional[str]): ETag(s) the client already holds.
 
     Returns:
-        list[dict]: Rows with name, wins, games_played, and win_rate.
+        list[dict] | Response: Rows with name, wins, games_played, and win_rate,
+        or a bare 304 response when the client copy is current.
     """
-    db_path = _db_path()
-    repo = BingoRepository(db_path)
-    try:
-        leaderboard = repo.get_leaderboard(limit=limit)
-        return leaderboard
-    finally:
-        repo.close()
+    rows = repo.get_leaderboard(limit=limit)
+    etag = _etag(rows)
+    if _etag_matches(etag, if_none_match):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return rows
 
 
 @app.get("/history", response_model=list[GameHistoryEntry])
-def get_history(limit: int = 200) -> list[dict]:
+def get_history(
+    repo: Repository,
+    limit: Annotated[int, Query(ge=1, le=MAX_HISTORY_LIMIT)] = 200,
+) -> list[dict]:
     """Return recent game history rows for analytics.
 
     Args:
-        limit (int): Maximum number of rows to return (default 200).
+        repo (BingoRepository): Shared repository (injected).
+        limit (int): Maximum number of rows to return (default 200, 1-1000; other values get a 422).
 
     Returns:
         list[dict]: History rows ordered newest first.
     """
-    db_path = _db_path()
-    repo = BingoRepository(db_path)
-    try:
-        return repo.get_game_history(limit=limit)
-    finally:
-        repo.close()
+    return repo.get_game_history(limit=limit)
 
 
 @app.post("/results", status_code=201, response_model=StatusResponse)
-def record_result(result: GameResultRequest) -> StatusResponse:
+def record_result(result: GameResultRequest, repo: Repository) -> StatusResponse:
     """Record a game result.
 
     Args:
         result (GameResultRequest): Game result data payload.
+        repo (BingoRepository): Shared repository (injected).
 
     Returns:
         StatusResponse: Success indicator.
@@ -90,8 +189,6 @@ def record_result(result: GameResultRequest) -> StatusResponse:
     Raises:
         HTTPException: Raised when the result cannot be persisted.
     """
-    db_path = _db_path()
-    repo = BingoRepository(db_path)
     try:
         repo.record_game_result(
             player_name=result.player_name,
@@ -103,5 +200,24 @@ def record_result(result: GameResultRequest) -> StatusResponse:
         return StatusResponse(status="ok")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
-    finally:
-        repo.close()
+
+
+@app.post("/results/batch", status_code=201, response_model=StatusResponse)
+def record_results(batch: GameResultBatchRequest, repo: Repository) -> StatusResponse:
+    """Record several game results atomically in one request.
+
+    Args:
+        batch (GameResultBatchRequest): Results to persist (e.g., every player of a round).
+        repo (BingoRepository): Shared repository (injected).
+
+    Returns:
+        StatusResponse: Success indicator.
+
+    Raises:
+        HTTPException: Raised when the results cannot be persisted.
+    """
+    try:
+        repo.record_game_results([result.model_dump() for result in batch.results])
+        return StatusResponse(status="ok")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
@@ -5,6 +5,13 @@ from __future__ import annotations
 
 from pydantic import BaseModel, Field
 
+__all__ = [
+    "GameHistoryEntry",
+    "GameResultBatchRequest",
+    "GameResultRequest",
+    "StatusResponse",
+]
+
 
 class GameResultRequest(BaseModel):
     """Request model for recording a game result."""
@@ -16,6 +23,12 @@ class GameResultRequest(BaseModel):
     draws_count: int = Field(..., ge=0, description="Number of draws taken")
 
 
+class GameResultBatchRequest(BaseModel):
+    """Request model for recording several game results in one call."""
+
+    results: list[GameResultRequest] = Field(..., min_length=1, description="Results to record")
+
+
 class StatusResponse(BaseModel):
     """Response model for status endpoints."""
 
@@ -4,8 +4,19 @@
 # PRAGMA statements
 PRAGMA_FOREIGN_KEYS = "PRAGMA foreign_keys = ON"
 PRAGMA_JOURNAL_MODE_WAL = "PRAGMA journal_mode = WAL"
+PRAGMA_SYNCHRONOUS_NORMAL = "PRAGMA synchronous = NORMAL"
+PRAGMA_TEMP_STORE_MEMORY = "PRAGMA temp_store = MEMORY"
+PRAGMA_MMAP_SIZE = "PRAGMA mmap_size = 268435456"
+PRAGMA_CACHE_SIZE = "PRAGMA cache_size = -65536"  # negative = KiB, i.e. 64 MiB
+PRAGMA_WAL_AUTOCHECKPOINT = "PRAGMA wal_autocheckpoint = 1000"
+PRAGMA_OPTIMIZE = "PRAGMA optimize"
+PRAGMA_OPTIMIZE_ON_OPEN = "PRAGMA optimize = 0x10002"  # analyze every table, no row limit
+PRAGMA_QUERY_ONLY = "PRAGMA query_only = ON"
 PRAGMA_TABLE_INFO_RESULTS = "PRAGMA table_info(results)"
 
+# Transaction control (the connection runs in autocommit mode)
+BEGIN_IMMEDIATE = "BEGIN IMMEDIATE"
+
 # Schema creation statements
 CREATE_TABLE_PLAYERS = """
     CREATE TABLE IF NOT EXISTS players (
@@ -35,19 +46,43 @@ CREATE_TABLE_RESULTS = """
     )
 """
 
+# Per-player win/game counters maintained at write time so the leaderboard
+# never has to aggregate the full results table.
+CREATE_TABLE_PLAYER_STATS = """
+    CREATE TABLE IF NOT EXISTS player_stats (
+        player_id INTEGER PRIMARY KEY,
+        wins INTEGER NOT NULL DEFAULT 0,
+        games_played INTEGER NOT NULL DEFAULT 0,
+        FOREIGN KEY (player_id) REFERENCES players(id)
+    )
+"""
+
 # Index creation statements
 CREATE_INDEX_PLAYERS_NAME = """
     CREATE INDEX IF NOT EXISTS idx_players_name ON players(name)
 """
 
-CREATE_INDEX_RESULTS_PLAYER_ID = """
-    CREATE INDEX IF NOT EXISTS idx_results_player_id ON results(player_id)
+# Covers the per-player SUM(won)/COUNT(*) rebuild so it never reads result rows;
+# it also serves player_id lookups, replacing the old single-column index.
+CREATE_INDEX_RESULTS_PLAYER_WON = """
+    CREATE INDEX IF NOT EXISTS idx_results_player_won ON results(player_id, won)
+"""
+
+DROP_INDEX_RESULTS_PLAYER_ID = "DROP INDEX IF EXISTS idx_results_player_id"
+
+# Lets the newest-first history query walk the index and stop after LIMIT rows
+CREATE_INDEX_RESULTS_PLAYED_AT = """
+    CREATE INDEX IF NOT EXISTS idx_results_played_at ON results(played_at DESC, id DESC)
 """
 
 CREATE_INDEX_RESULTS_GAME_ID = """
     CREATE INDEX IF NOT EXISTS idx_results_game_id ON results(game_id)
 """
 
+CREATE_INDEX_PLAYER_STATS_RANK = """
+    CREATE INDEX IF NOT EXISTS idx_player_stats_rank ON player_stats(wins DESC, games_played DESC)
+"""
+
 # Player queries
 SELECT_PLAYER_BY_NAME = "SELECT id FROM players WHERE name = ?"
 INSERT_PLAYER = "INSERT INTO players (name) VALUES (?)"
@@ -61,22 +96,30 @@ DELETE_ZERO_DRAW_WINS = "DELETE FROM results WHERE won = 1 AND draws_count <= 0"
 ALTER_RESULTS_ADD_PLAYED_AT = "ALTER TABLE results ADD COLUMN played_at TEXT"
 BACKFILL_PLAYED_AT = "UPDATE results SET played_at = datetime('now') WHERE played_at IS NULL"
 
-# Leaderboard query
+# Player stats queries
+UPSERT_PLAYER_STATS = """
+    INSERT INTO player_stats (player_id, wins, games_played) VALUES (?, ?, 1)
+    ON CONFLICT(player_id) DO UPDATE SET
+        wins = wins + excluded.wins,
+        games_played = games_played + 1
+"""
+DELETE_PLAYER_STATS = "DELETE FROM player_stats"
+REBUILD_PLAYER_STATS = """
+    INSERT INTO player_stats (player_id, wins, games_played)
+    SELECT player_id, SUM(won), COUNT(*) FROM results GROUP BY player_id
+"""
+
+# Leaderboard query (served from the player_stats counters)
 SELECT_LEADERBOARD = """
     SELECT
         p.name,
-        COUNT(CASE WHEN r.won = 1 THEN 1 END) AS wins,
-        COUNT(r.id) AS games_played,
-        CASE
-            WHEN COUNT(r.id) > 0
-            THEN CAST(COUNT(CASE WHEN r.won = 1 THEN 1 END) AS REAL) / COUNT(r.id)
-            ELSE 0.0
-        END AS win_rate
-    FROM players p
-    LEFT JOIN results r ON p.id = r.player_id
-    GROUP BY p.id, p.name
-    HAVING COUNT(r.id) > 0
-    ORDER BY wins DESC, games_played DESC
+        s.wins,
+        s.games_played,
+        CAST(s.wins AS REAL) / s.games_played AS win_rate
+    FROM player_stats s
+    JOIN players p ON p.id = s.player_id
+    WHERE s.games_played > 0
+    ORDER BY s.wins DESC, s.games_played DESC
     LIMIT ?
 """
 
@@ -89,7 +132,7 @@ SELECT_GAME_HISTORY = """
         g.pool_max,
         r.won,
         r.draws_count,
-        COALESCE(r.played_at, datetime('now')) AS played_at
+        r.played_at
     FROM results r
     JOIN players p ON r.player_id = p.id
     JOIN games g ON r.game_id = g.id
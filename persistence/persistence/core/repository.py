@@ -3,54 +3,179 @@
 
 from __future__ import annotations
 
+import queue
 import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
 from persistence.core.constants import (
     ALTER_RESULTS_ADD_PLAYED_AT,
     BACKFILL_PLAYED_AT,
+    BEGIN_IMMEDIATE,
+    CREATE_INDEX_PLAYER_STATS_RANK,
     CREATE_INDEX_PLAYERS_NAME,
     CREATE_INDEX_RESULTS_GAME_ID,
-    CREATE_INDEX_RESULTS_PLAYER_ID,
+    CREATE_INDEX_RESULTS_PLAYED_AT,
+    CREATE_INDEX_RESULTS_PLAYER_WON,
     CREATE_TABLE_GAMES,
+    CREATE_TABLE_PLAYER_STATS,
     CREATE_TABLE_PLAYERS,
     CREATE_TABLE_RESULTS,
+    DELETE_PLAYER_STATS,
     DELETE_ZERO_DRAW_WINS,
+    DROP_INDEX_RESULTS_PLAYER_ID,
     INSERT_GAME,
     INSERT_PLAYER,
     INSERT_RESULT,
+    PRAGMA_CACHE_SIZE,
     PRAGMA_FOREIGN_KEYS,
     PRAGMA_JOURNAL_MODE_WAL,
+    PRAGMA_MMAP_SIZE,
+    PRAGMA_OPTIMIZE,
+    PRAGMA_OPTIMIZE_ON_OPEN,
+    PRAGMA_QUERY_ONLY,
+    PRAGMA_SYNCHRONOUS_NORMAL,
     PRAGMA_TABLE_INFO_RESULTS,
+    PRAGMA_TEMP_STORE_MEMORY,
+    PRAGMA_WAL_AUTOCHECKPOINT,
+    REBUILD_PLAYER_STATS,
     SELECT_GAME_HISTORY,
     SELECT_LEADERBOARD,
     SELECT_PLAYER_BY_NAME,
+    UPSERT_PLAYER_STATS,
 )
 
+# Performance-only settings, applied best effort. With WAL, synchronous=NORMAL
+# fsyncs at checkpoints rather than on every commit: a power loss can drop the
+# last few committed results but never corrupts the database, which is an
+# acceptable trade for a leaderboard.
+_WRITER_PRAGMAS = (
+    PRAGMA_SYNCHRONOUS_NORMAL,
+    PRAGMA_CACHE_SIZE,
+    PRAGMA_TEMP_STORE_MEMORY,
+    PRAGMA_MMAP_SIZE,
+    PRAGMA_WAL_AUTOCHECKPOINT,
+)
+_READER_PRAGMAS = (PRAGMA_CACHE_SIZE, PRAGMA_TEMP_STORE_MEMORY, PRAGMA_MMAP_SIZE)
+
+# Leaderboard pages are reused until a write through this repository, or for
+# at most this long, which bounds staleness from writers in other processes.
+LEADERBOARD_CACHE_TTL_SECONDS = 5.0
+_LEADERBOARD_CACHE_MAX_ENTRIES = 32
+
+# Refresh planner statistics after this many committed writes on a long-lived connection.
+_OPTIMIZE_EVERY = 1000
+
+
+def _apply_pragmas(conn: sqlite3.Connection, pragmas: tuple[str, ...]) -> None:
+    """Execute tuning pragmas, skipping any the SQLite build or filesystem rejects."""
+    for pragma in pragmas:
+        try:
+            conn.execute(pragma)
+        except sqlite3.Error:
+            pass
+
 
 class BingoRepository:
     """Repository for managing Bingo game data in SQLite.
 
     Handles player management, game recording, and leaderboard queries.
     Supports context manager usage for automatic connection cleanup.
+
+    One instance may be shared across threads. Writes go through a single
+    writer connection guarded by an internal lock, so transactions from
+    different requests never interleave. File databases also keep a small pool
+    of read-only connections; under WAL these read concurrently with each other
+    and with the writer instead of queueing on the lock.
     """
 
-    def __init__(self, db_path: str) -> None:
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        readers: int = 2,
+        leaderboard_ttl: float = LEADERBOARD_CACHE_TTL_SECONDS,
+    ) -> None:
         """Initialize the repository with a database connection.
 
         Args:
             db_path: Path to SQLite database file, or ":memory:" for in-memory DB.
+            readers: Number of pooled read-only connections (ignored for ":memory:",
+                where every connection would be a separate database).
+            leaderboard_ttl: Seconds a cached leaderboard page may be served; 0 disables caching.
         """
         self._db_path = db_path
-        self._conn: sqlite3.Connection | None = sqlite3.connect(db_path)
-        self._create_schema()
+        self._lock = threading.Lock()
+        self._leaderboard_ttl = leaderboard_ttl
+        # limit -> (write version, expiry, rows); the version bumps on every commit
+        self._leaderboard_cache: dict[int, tuple[int, float, list[dict[str, Any]]]] = {}
+        self._write_version = 0
+        # Autocommit mode: writes open their own BEGIN IMMEDIATE transaction.
+        self._conn: sqlite3.Connection | None = sqlite3.connect(
+            db_path, check_same_thread=False, isolation_level=None
+        )
+        # Writes all run under the lock, so one long-lived cursor serves them.
+        self._cursor = self._conn.cursor()
+        self._writes_since_optimize = 0
+        try:
+            self._create_schema()
+        except BaseException:
+            self._conn.close()
+            self._conn = None
+            raise
+        _apply_pragmas(self._conn, (PRAGMA_OPTIMIZE_ON_OPEN,))
+        self._readers: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+        if db_path != ":memory:":
+            for _ in range(readers):
+                self._readers.put(self._open_reader())
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a read-only connection to the repository database."""
+        conn = sqlite3.connect(self._db_path, check_same_thread=False, isolation_level=None)
+        conn.execute(PRAGMA_QUERY_ONLY)
+        # Same constraint settings as the writer, so every connection enforces foreign keys.
+        conn.execute(PRAGMA_FOREIGN_KEYS)
+        _apply_pragmas(conn, _READER_PRAGMAS)
+        return conn
+
+    def _fetch_all(self, sql: str, params: tuple[Any, ...]) -> list[tuple[Any, ...]]:
+        """Run a read query on a pooled reader, or on the writer when none is free.
+
+        Args:
+            sql: SELECT statement to run.
+            params: Bound parameters for ``sql``.
+
+        Returns:
+            All result rows.
+        """
+        try:
+            reader = self._readers.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if self._conn is None:
+                    raise RuntimeError("Repository connection is closed") from None
+                return self._cursor.execute(sql, params).fetchall()
+        try:
+            return reader.execute(sql, params).fetchall()
+        finally:
+            if self._conn is None:
+                reader.close()  # the repository was closed while this read ran
+            else:
+                self._readers.put(reader)
 
     def _create_schema(self) -> None:
-        """Create database tables and indexes if they don't exist."""
+        """Create database tables and indexes if they don't exist.
+
+        Everything after the pragmas runs in one transaction that is rolled back
+        if any step fails, so a failed open never leaves the write lock held.
+        """
         if self._conn is None:
             return
 
-        cursor = self._conn.cursor()
+        cursor = self._cursor
 
         # Enable foreign keys
         cursor.execute(PRAGMA_FOREIGN_KEYS)
@@ -61,38 +186,89 @@ class BingoRepository:
         except sqlite3.Error:
             pass  # WAL may not be available in all SQLite versions
 
-        # Players table
-        cursor.execute(CREATE_TABLE_PLAYERS)
+        _apply_pragmas(self._conn, _WRITER_PRAGMAS)
 
-        # Games table
-        cursor.execute(CREATE_TABLE_GAMES)
-
-        # Results table
-        cursor.execute(CREATE_TABLE_RESULTS)
+        # Run the schema setup, migration and stats rebuild as one transaction
+        cursor.execute(BEGIN_IMMEDIATE)
+        try:
+            # Players table
+            cursor.execute(CREATE_TABLE_PLAYERS)
+
+            # Games table
+            cursor.execute(CREATE_TABLE_GAMES)
+
+            # Results table
+            cursor.execute(CREATE_TABLE_RESULTS)
+
+            # Leaderboard counters table
+            cursor.execute(CREATE_TABLE_PLAYER_STATS)
+
+            # Indexes for performance
+            cursor.execute(CREATE_INDEX_PLAYERS_NAME)
+            cursor.execute(CREATE_INDEX_RESULTS_PLAYER_WON)
+            cursor.execute(DROP_INDEX_RESULTS_PLAYER_ID)
+            cursor.execute(CREATE_INDEX_RESULTS_GAME_ID)
+            cursor.execute(CREATE_INDEX_PLAYER_STATS_RANK)
+
+            # Lightweight migration for analytics: ensure played_at exists on results
+            cursor.execute(PRAGMA_TABLE_INFO_RESULTS)
+            columns = {row[1] for row in cursor.fetchall()}
+            if "played_at" not in columns:
+                # SQLite disallows non-constant defaults in ALTER TABLE. Add column, then backfill.
+                cursor.execute(ALTER_RESULTS_ADD_PLAYED_AT)
+                cursor.execute(BACKFILL_PLAYED_AT)
+                # Future inserts will rely on the default in CREATE_TABLE_RESULTS; existing rows are backfilled.
+            cursor.execute(CREATE_INDEX_RESULTS_PLAYED_AT)
+
+            # Cleanup: remove invalid wins with zero draws (buggy legacy rows)
+            cursor.execute(DELETE_ZERO_DRAW_WINS)
+
+            # Recompute the counters from results so they match after the cleanup
+            # above and for databases created before player_stats existed.
+            cursor.execute(DELETE_PLAYER_STATS)
+            cursor.execute(REBUILD_PLAYER_STATS)
 
-        # Indexes for performance
-        cursor.execute(CREATE_INDEX_PLAYERS_NAME)
-        cursor.execute(CREATE_INDEX_RESULTS_PLAYER_ID)
-        cursor.execute(CREATE_INDEX_RESULTS_GAME_ID)
+            self._conn.commit()
+        except BaseException:
+            self._conn.rollback()
+            raise
 
-        # Lightweight migration for analytics: ensure played_at exists on results
-        cursor.execute(PRAGMA_TABLE_INFO_RESULTS)
-        columns = {row[1] for row in cursor.fetchall()}
-        if "played_at" not in columns:
-            # SQLite disallows non-constant defaults in ALTER TABLE. Add column, then backfill.
-            cursor.execute(ALTER_RESULTS_ADD_PLAYED_AT)
-            cursor.execute(BACKFILL_PLAYED_AT)
-            # Future inserts will rely on the default in CREATE_TABLE_RESULTS; existing rows are backfilled.
+    @contextmanager
+    def _write_transaction(self) -> Iterator[None]:
+        """Hold the repository lock and run the block in one ``BEGIN IMMEDIATE`` transaction.
 
-        # Cleanup: remove invalid wins with zero draws (buggy legacy rows)
-        cursor.execute(DELETE_ZERO_DRAW_WINS)
+        Taking the write lock up front means a writer never fails half-way on a
+        busy database; the transaction commits on success and rolls back on error,
+        including when the commit itself fails.
 
-        self._conn.commit()
+        Raises:
+            RuntimeError: If the repository is closed (checked under the lock, so a
+                concurrent ``close()`` cannot slip in between).
+        """
+        with self._lock:
+            if self._conn is None:
+                raise RuntimeError("Repository connection is closed")
+            self._conn.execute(BEGIN_IMMEDIATE)
+            try:
+                yield
+                # Inside the try: a failed COMMIT (e.g. a deferred constraint) must
+                # still roll back, or the shared connection stays in a transaction.
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+            self._write_version += 1
+            # Counted only after the commit, so rolled-back writes never trigger an optimize
+            self._writes_since_optimize += 1
+            if self._writes_since_optimize >= _OPTIMIZE_EVERY:
+                self._writes_since_optimize = 0
+                _apply_pragmas(self._conn, (PRAGMA_OPTIMIZE,))
 
     def _get_or_create_player(self, name: str) -> int:
         """Get existing player ID or create a new player.
 
-        Empty or whitespace-only names are normalized to "Anonymous".
+        Empty or whitespace-only names are normalized to "Anonymous". Outside a
+        write transaction the insert commits on its own (autocommit mode).
 
         Args:
             name: Player name (may be empty or whitespace).
@@ -104,9 +280,9 @@ class BingoRepository:
             raise RuntimeError("Repository connection is closed")
 
         # Normalize empty/whitespace names to "Anonymous"
-        normalized_name = name.strip() if name.strip() else "Anonymous"
+        normalized_name = name.strip() or "Anonymous"
 
-        cursor = self._conn.cursor()
+        cursor = self._cursor
 
         # Try to get existing player
         cursor.execute(SELECT_PLAYER_BY_NAME, (normalized_name,))
@@ -117,7 +293,6 @@ class BingoRepository:
 
         # Create new player
         cursor.execute(INSERT_PLAYER, (normalized_name,))
-        self._conn.commit()
         return cursor.lastrowid
 
     def record_game_result(
@@ -140,32 +315,70 @@ class BingoRepository:
             won: Whether the player won.
             draws_count: Number of draws taken.
         """
-        if self._conn is None:
-            raise RuntimeError("Repository connection is closed")
+        try:
+            with self._write_transaction():
+                self._insert_game_result(player_name, board_size, pool_max, won, draws_count)
+        except sqlite3.Error as e:
+            raise RuntimeError(f"Failed to record game result: {e}") from e
 
-        cursor = self._conn.cursor()
+    def record_game_results(self, results: list[dict[str, Any]]) -> None:
+        """Record several game results in a single transaction.
 
-        try:
-            # Get or create player
-            player_id = self._get_or_create_player(player_name)
-
-            # Create game entry
-            cursor.execute(
-                INSERT_GAME,
-                (board_size, pool_max),
-            )
-            game_id = cursor.lastrowid
-
-            # Create result entry
-            cursor.execute(
-                INSERT_RESULT,
-                (player_id, game_id, 1 if won else 0, draws_count),
-            )
+        Either every result is stored or none is (the transaction is rolled back).
 
-            self._conn.commit()
+        Args:
+            results: Rows with keys player_name, board_size, pool_max, won, draws_count.
+        """
+        try:
+            with self._write_transaction():
+                for row in results:
+                    self._insert_game_result(
+                        row["player_name"],
+                        row["board_size"],
+                        row["pool_max"],
+                        row["won"],
+                        row["draws_count"],
+                    )
         except sqlite3.Error as e:
-            self._conn.rollback()
-            raise RuntimeError(f"Failed to record game result: {e}") from e
+            raise RuntimeError(f"Failed to record game results: {e}") from e
+
+    def _insert_game_result(
+        self,
+        player_name: str,
+        board_size: int,
+        pool_max: int,
+        won: bool,
+        draws_count: int,
+    ) -> None:
+        """Insert the game and result rows for one player without committing.
+
+        Args:
+            player_name: Display name of the player.
+            board_size: Board dimension (N for N×N grid).
+            pool_max: Maximum number in the draw pool.
+            won: Whether the player won.
+            draws_count: Number of draws taken.
+        """
+        cursor = self._cursor
+
+        # Get or create player
+        player_id = self._get_or_create_player(player_name)
+
+        # Create game entry
+        cursor.execute(
+            INSERT_GAME,
+            (board_size, pool_max),
+        )
+        game_id = cursor.lastrowid
+
+        # Create result entry
+        cursor.execute(
+            INSERT_RESULT,
+            (player_id, game_id, 1 if won else 0, draws_count),
+        )
+
+        # Keep the leaderboard counters in step with the result row
+        cursor.execute(UPSERT_PLAYER_STATS, (player_id, 1 if won else 0))
 
     def get_leaderboard(self, limit: int = 10) -> list[dict[str, Any]]:
         """Get leaderboard entries sorted by wins and games played.
@@ -173,6 +386,10 @@ class BingoRepository:
         Args:
             limit: Maximum number of entries to return. Invalid values default to 1.
 
+        Pages are cached per limit until the next write through this repository
+        (or ``leaderboard_ttl`` seconds); the returned rows are shared and must
+        not be mutated.
+
         Returns:
             List of dictionaries with keys: name, wins, games_played, win_rate.
         """
@@ -185,20 +402,29 @@ class BingoRepository:
         except (ValueError, TypeError):
             limit_int = 1
 
-        cursor = self._conn.cursor()
+        # Read the version before querying so a concurrent write can only make
+        # the cached page look older than it is, never newer.
+        version = self._write_version
+        now = time.monotonic()
+        cached = self._leaderboard_cache.get(limit_int)
+        if cached is not None and cached[0] == version and now < cached[1]:
+            return cached[2]
 
-        cursor.execute(SELECT_LEADERBOARD, (limit_int,))
-
-        rows = cursor.fetchall()
-        return [
+        rows = self._fetch_all(SELECT_LEADERBOARD, (limit_int,))
+        leaderboard = [
             {
                 "name": row[0],
                 "wins": row[1],
                 "games_played": row[2],
-                "win_rate": float(row[3]),
+                "win_rate": row[3],  # already REAL via CAST in the query
             }
             for row in rows
         ]
+        if self._leaderboard_ttl > 0:
+            if len(self._leaderboard_cache) >= _LEADERBOARD_CACHE_MAX_ENTRIES:
+                self._leaderboard_cache.clear()
+            self._leaderboard_cache[limit_int] = (version, now + self._leaderboard_ttl, leaderboard)
+        return leaderboard
 
     def get_game_history(self, limit: int = 200) -> list[dict[str, Any]]:
         """Return recent game history rows for analytics.
@@ -217,9 +443,7 @@ class BingoRepository:
         except (ValueError, TypeError):
             limit_int = 200
 
-        cursor = self._conn.cursor()
-        cursor.execute(SELECT_GAME_HISTORY, (limit_int,))
-        rows = cursor.fetchall()
+        rows = self._fetch_all(SELECT_GAME_HISTORY, (limit_int,))
         return [
             {
                 "id": row[0],
@@ -236,11 +460,19 @@ class BingoRepository:
     def close(self) -> None:
         """Close the database connection.
 
+        Runs ``PRAGMA optimize`` first so the next open plans with fresh statistics.
         Safe to call multiple times (idempotent).
         """
-        if self._conn is not None:
-            self._conn.close()
-            self._conn = None
+        with self._lock:
+            if self._conn is not None:
+                _apply_pragmas(self._conn, (PRAGMA_OPTIMIZE,))
+                self._conn.close()
+                self._conn = None
+            while True:
+                try:
+                    self._readers.get_nowait().close()
+                except queue.Empty:
+                    break
 
     def __enter__(self) -> BingoRepository:
         """Context manager entry."""
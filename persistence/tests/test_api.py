@@ -8,7 +8,7 @@ from unittest.mock import patch
 import pytest
 from fastapi.testclient import TestClient
 
-from persistence.api.api import _db_path, app
+from persistence.api.api import _db_path, _repositories, _repository, _resolve_db_path, app
 
 
 class TestDatabasePathConfiguration:
@@ -32,6 +32,16 @@ class TestDatabasePathConfiguration:
             path = _db_path()
             assert path == ":memory:"
 
+    def test_db_path_resolved_once_per_value(self):
+        """Test that repeated lookups reuse the resolved path until the env var changes."""
+        with patch.dict(os.environ, {"BINGO_DB_PATH": "/cached/one.db"}):
+            first = _db_path()
+            hits = _resolve_db_path.cache_info().hits
+            assert _db_path() == first
+            assert _resolve_db_path.cache_info().hits == hits + 1
+        with patch.dict(os.environ, {"BINGO_DB_PATH": "/cached/two.db"}):
+            assert _db_path() == str(Path("/cached/two.db").resolve())
+
 
 class TestAPIEndpoints:
     """Tests for API endpoint functionality."""
@@ -61,6 +71,11 @@ class TestAPIEndpoints:
         assert response.status_code == 200
         assert isinstance(response.json(), list)
 
+        # Out-of-range limits are rejected before reaching the repository
+        assert test_client.get("/leaderboard?limit=0").status_code == 422
+        assert test_client.get("/leaderboard?limit=101").status_code == 422
+        assert test_client.get("/history?limit=1001").status_code == 422
+
     def test_record_result_endpoint(self, test_client):
         """Test the record result endpoint with win and loss scenarios."""
         # Test recording a win
@@ -111,6 +126,26 @@ class TestAPIEndpoints:
         assert len(leaderboard) > 0
         assert any(row["name"] == "Alice" for row in leaderboard)
 
+    def test_leaderboard_etag(self, test_client):
+        """Test that a matching If-None-Match gets a 304 until the leaderboard changes."""
+        first = test_client.get("/leaderboard")
+        etag = first.headers["ETag"]
+
+        cached = test_client.get("/leaderboard", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["ETag"] == etag
+        assert test_client.get("/leaderboard?limit=5", headers={"If-None-Match": f'W/{etag}'}).status_code == 304
+
+        test_client.post(
+            "/results",
+            json={"player_name": "Etag", "board_size": 3, "pool_max": 30, "won": True, "draws_count": 4},
+        )
+        fresh = test_client.get("/leaderboard", headers={"If-None-Match": etag})
+        assert fresh.status_code == 200
+        assert fresh.headers["ETag"] != etag
+        assert fresh.json()[0]["name"] == "Etag"
+
     def test_history_endpoint(self, test_client):
         """Test the history endpoint returns recent games with required fields."""
         test_client.post(
@@ -130,3 +165,55 @@ class TestAPIEndpoints:
         assert isinstance(payload, list)
         assert len(payload) >= 1
         assert {"id", "name", "board_size", "pool_max", "won", "draws_count", "played_at"} <= payload[0].keys()
+
+    def test_record_results_batch_endpoint(self, test_client):
+        """Test that the batch endpoint records every result in one request."""
+        response = test_client.post(
+            "/results/batch",
+            json={
+                "results": [
+                    {"player_name": "Alice", "board_size": 5, "pool_max": 75, "won": True, "draws_count": 12},
+                    {"player_name": "Bob", "board_size": 5, "pool_max": 75, "won": False, "draws_count": 12},
+                ]
+            },
+        )
+        assert response.status_code == 201
+        assert response.json() == {"status": "ok"}
+
+        leaderboard = test_client.get("/leaderboard").json()
+        assert {row["name"] for row in leaderboard} == {"Alice", "Bob"}
+
+    def test_record_results_batch_rejects_empty(self, test_client):
+        """Test that an empty batch is rejected by validation."""
+        response = test_client.post("/results/batch", json={"results": []})
+        assert response.status_code == 422
+
+
+class TestSharedRepository:
+    """Tests for the per-path repository shared across requests."""
+
+    def test_repository_reused_across_requests(self, tmp_path):
+        """Test that requests for the same database path share one repository."""
+        db_path = tmp_path / "shared.db"
+        with patch.dict(os.environ, {"BINGO_DB_PATH": str(db_path)}):
+            first = _repository()
+            assert _repository() is first
+            with TestClient(app) as client:
+                client.post(
+                    "/results",
+                    json={"player_name": "Alice", "board_size": 3, "pool_max": 30, "won": True, "draws_count": 5},
+                )
+                assert client.get("/leaderboard").json()[0]["name"] == "Alice"
+        # Leaving the client runs the shutdown hook, which closes shared repositories.
+        assert str(db_path.resolve()) not in _repositories
+
+    def test_memory_database_persists_between_requests(self):
+        """Test that an in-memory database keeps results across requests."""
+        with patch.dict(os.environ, {"BINGO_DB_PATH": ":memory:"}):
+            with TestClient(app) as client:
+                client.post(
+                    "/results",
+                    json={"player_name": "Mem", "board_size": 3, "pool_max": 30, "won": False, "draws_count": 9},
+                )
+                history = client.get("/history").json()
+        assert [row["name"] for row in history] == ["Mem"]
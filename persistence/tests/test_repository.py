@@ -2,6 +2,9 @@
 """Unit tests for BingoRepository class."""
 
 import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -10,13 +13,15 @@ from persistence.core.constants import (
     INSERT_GAME,
     INSERT_RESULT,
     PRAGMA_FOREIGN_KEYS,
+    REBUILD_PLAYER_STATS,
     SELECT_COUNT_GAMES,
     SELECT_COUNT_RESULTS,
     SELECT_GAME_FIELDS,
+    SELECT_GAME_HISTORY,
     SELECT_PLAYER_BY_ID,
     SELECT_RESULT_FIELDS,
 )
-from persistence.core.repository import BingoRepository
+from persistence.core.repository import BingoRepository, _apply_pragmas
 
 
 class TestBingoRepositorySchema:
@@ -51,6 +56,17 @@ class TestBingoRepositorySchema:
             assert any("results" in name.lower() and "player" in name.lower() for name in index_names)
             assert any("results" in name.lower() and "game" in name.lower() for name in index_names)
 
+            # The per-player stats rebuild is an index-only scan
+            cur.execute(f"EXPLAIN QUERY PLAN {REBUILD_PLAYER_STATS}")
+            plan = " ".join(row[-1] for row in cur.fetchall())
+            assert "COVERING INDEX idx_results_player_won" in plan
+
+            # Newest-first history walks the played_at index instead of sorting
+            cur.execute(f"EXPLAIN QUERY PLAN {SELECT_GAME_HISTORY}", (10,))
+            plan = " ".join(row[-1] for row in cur.fetchall())
+            assert "idx_results_played_at" in plan
+            assert "TEMP B-TREE" not in plan
+
             conn.close()
         finally:
             repo.close()
@@ -67,6 +83,46 @@ class TestBingoRepositorySchema:
         finally:
             repo.close()
 
+    def test_failed_schema_setup_releases_write_lock(self, tmp_path: Path, monkeypatch):
+        """Tests that a failing schema step rolls back and closes the new connection.
+
+        Validates:
+            - The error propagates out of the constructor.
+            - The write lock is released, so the next open succeeds without waiting.
+        """
+        db_path = str(tmp_path / "test.db")
+        monkeypatch.setattr("persistence.core.repository.REBUILD_PLAYER_STATS", "INSERT INTO missing VALUES (1)")
+        with pytest.raises(sqlite3.OperationalError):
+            BingoRepository(db_path)
+        monkeypatch.undo()
+
+        blocker = sqlite3.connect(db_path, timeout=0)
+        blocker.execute("BEGIN IMMEDIATE")  # fails fast if the write lock were still held
+        blocker.rollback()
+        blocker.close()
+        with BingoRepository(db_path) as repo:
+            assert repo.get_leaderboard(limit=10) == []
+
+    def test_connection_pragmas(self, tmp_path: Path):
+        """Tests that the connection is opened in WAL/autocommit mode with tuned pragmas."""
+        repo = BingoRepository(str(tmp_path / "test.db"))
+        try:
+            conn = repo._conn
+            assert conn.isolation_level is None
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] == -65536
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+            reader = repo._readers.get_nowait()
+            try:
+                assert reader.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+                assert reader.execute("PRAGMA query_only").fetchone()[0] == 1
+            finally:
+                repo._readers.put(reader)
+        finally:
+            repo.close()
+
 
 class TestBingoRepositoryPlayerManagement:
     """Tests for player creation and management."""
@@ -219,6 +275,56 @@ class TestBingoRepositoryGameResults:
 
         conn.close()
 
+    def test_record_game_results_batch(self, repo, tmp_path: Path):
+        """Tests that record_game_results stores every row in one transaction."""
+        repo.record_game_results(
+            [
+                {"player_name": "Ann", "board_size": 3, "pool_max": 30, "won": True, "draws_count": 6},
+                {"player_name": "Ben", "board_size": 3, "pool_max": 30, "won": False, "draws_count": 6},
+            ]
+        )
+
+        conn = sqlite3.connect(str(tmp_path / "test.db"))
+        cur = conn.cursor()
+        cur.execute(SELECT_COUNT_RESULTS)
+        assert cur.fetchone()[0] == 2
+        conn.close()
+
+    def test_record_game_results_rolls_back_on_error(self, repo, tmp_path: Path):
+        """Tests that a failing row leaves no partial batch behind."""
+        with pytest.raises(RuntimeError, match="Failed to record game results"):
+            repo.record_game_results(
+                [
+                    {"player_name": "Ann", "board_size": 3, "pool_max": 30, "won": True, "draws_count": 6},
+                    {"player_name": "Ben", "board_size": 2, "pool_max": 30, "won": False, "draws_count": 6},
+                ]
+            )
+
+        conn = sqlite3.connect(str(tmp_path / "test.db"))
+        cur = conn.cursor()
+        cur.execute(SELECT_COUNT_RESULTS)
+        assert cur.fetchone()[0] == 0
+        conn.close()
+
+
+    def test_failed_commit_rolls_back(self, repo):
+        """Tests that a COMMIT failure leaves the shared connection usable.
+
+        Validates:
+            - A deferred foreign-key violation surfaces when committing.
+            - The transaction is rolled back, so later writes can begin a new one.
+        """
+        with pytest.raises(sqlite3.IntegrityError):
+            with repo._write_transaction():
+                repo._conn.execute("PRAGMA defer_foreign_keys = ON")
+                repo._conn.execute(
+                    "INSERT INTO results (player_id, game_id, won, draws_count) VALUES (999, 999, 0, 5)"
+                )
+        assert repo._conn.in_transaction is False
+
+        repo.record_game_result("Ann", 3, 30, True, 6)
+        assert repo.get_leaderboard(limit=10)[0]["name"] == "Ann"
+
 
 class TestBingoRepositoryLeaderboard:
     """Tests for leaderboard functionality."""
@@ -274,6 +380,64 @@ class TestBingoRepositoryLeaderboard:
         assert leaderboard[2]["wins"] == 1
         assert leaderboard[2]["games_played"] == 1
 
+    def test_get_leaderboard_counters_match_results(self, tmp_path: Path):
+        """Tests that player_stats counters agree with the results table.
+
+        Validates:
+            - Single and batched writes update the counters.
+            - A failed batch leaves the counters untouched.
+            - Re-opening the database rebuilds identical counters.
+        """
+        db_path = str(tmp_path / "stats.db")
+        with BingoRepository(db_path) as repo:
+            repo.record_game_result("Ann", 3, 30, True, 5)
+            repo.record_game_results(
+                [
+                    {"player_name": "Ann", "board_size": 3, "pool_max": 30, "won": False, "draws_count": 9},
+                    {"player_name": "Ben", "board_size": 3, "pool_max": 30, "won": True, "draws_count": 9},
+                ]
+            )
+            with pytest.raises(RuntimeError):
+                repo.record_game_results(
+                    [
+                        {"player_name": "Ben", "board_size": 3, "pool_max": 30, "won": True, "draws_count": 4},
+                        {"player_name": "Ben", "board_size": 2, "pool_max": 30, "won": True, "draws_count": 4},
+                    ]
+                )
+            before = repo.get_leaderboard()
+
+        with BingoRepository(db_path) as repo:
+            assert repo.get_leaderboard() == before
+        assert {row["name"]: (row["wins"], row["games_played"]) for row in before} == {
+            "Ann": (1, 2),
+            "Ben": (1, 1),
+        }
+
+    def test_get_leaderboard_cache(self, tmp_path: Path, monkeypatch):
+        """Tests that leaderboard pages are cached until a write or the TTL expires.
+
+        Validates:
+            - Repeated reads with the same limit reuse the cached page.
+            - A write through the repository invalidates it immediately.
+            - A write from another connection shows up once the TTL has passed.
+        """
+        clock = [1000.0]
+        monkeypatch.setattr("persistence.core.repository.time.monotonic", lambda: clock[0])
+        db_path = tmp_path / "cache.db"
+        with BingoRepository(str(db_path), leaderboard_ttl=5.0) as repo:
+            repo.record_game_result("Ann", 3, 30, True, 5)
+            first = repo.get_leaderboard()
+            assert repo.get_leaderboard() is first
+
+            repo.record_game_result("Ann", 3, 30, True, 6)
+            assert repo.get_leaderboard()[0]["wins"] == 2
+
+            with BingoRepository(str(db_path), leaderboard_ttl=0) as other:
+                other.record_game_result("Ann", 3, 30, True, 7)
+            assert repo.get_leaderboard()[0]["wins"] == 2
+            clock[0] += 5.0
+            assert repo.get_leaderboard()[0]["wins"] == 3
+
     def test_get_leaderboard_limit(self, repo):
         """Tests that leaderboard respects the `limit` parameter."""
         for i in range(5):
@@ -325,6 +489,113 @@ class TestBingoRepositoryLifecycle:
         repo.close()
         assert repo._conn is None
 
+    def test_write_racing_close_raises_runtime_error(self, tmp_path: Path):
+        """Tests that a write blocked behind close() reports the closed repository."""
+        repo = BingoRepository(str(tmp_path / "test.db"))
+        errors: list[BaseException] = []
+
+        def write():
+            try:
+                repo.record_game_result("Ann", 3, 30, True, 6)
+            except BaseException as e:
+                errors.append(e)
+
+        with repo._lock:
+            worker = threading.Thread(target=write)
+            worker.start()
+            time.sleep(0.1)  # let the writer block on the lock
+            # What close() does while it holds the lock
+            repo._conn.close()
+            repo._conn = None
+        worker.join()
+        repo.close()
+
+        assert len(errors) == 1
+        assert isinstance(errors[0], RuntimeError)
+        assert "closed" in str(errors[0])
+
+    def test_shared_across_threads(self, tmp_path: Path):
+        """Tests that one repository can serve concurrent writers and readers.
+
+        Validates:
+            - Writes from worker threads do not raise cross-thread errors.
+            - Every write is stored exactly once.
+        """
+        with BingoRepository(str(tmp_path / "test.db")) as repo:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                list(pool.map(lambda i: repo.record_game_result(f"P{i % 4}", 3, 30, i % 2 == 0, 5), range(40)))
+                list(pool.map(lambda _: repo.get_leaderboard(limit=10), range(8)))
+
+            assert sum(row["games_played"] for row in repo.get_leaderboard(limit=10)) == 40
+
+    def test_refreshes_planner_statistics(self, tmp_path: Path, monkeypatch):
+        """Tests that PRAGMA optimize runs after enough writes and on close.
+
+        Validates:
+            - The write counter resets once the optimize threshold is reached.
+            - Rolled-back writes do not count toward the threshold.
+            - close() optimizes before closing the writer connection.
+        """
+        monkeypatch.setattr("persistence.core.repository._OPTIMIZE_EVERY", 3)
+        repo = BingoRepository(str(tmp_path / "test.db"))
+        statements = []
+        repo._conn.set_trace_callback(statements.append)
+        for i in range(4):
+            repo.record_game_result(f"P{i}", 3, 30, True, 5)
+        assert repo._writes_since_optimize == 1
+        assert statements.count("PRAGMA optimize") == 1
+
+        good = {"player_name": "Ok", "board_size": 3, "pool_max": 30, "won": True, "draws_count": 5}
+        with pytest.raises(RuntimeError):
+            # The second row violates the board_size CHECK, so the whole batch rolls back
+            repo.record_game_results([good, {**good, "board_size": 2}])
+        assert repo._writes_since_optimize == 1
+
+        repo.close()
+        assert statements.count("PRAGMA optimize") == 2
+
+    def test_optimizes_once_on_open(self, tmp_path: Path, monkeypatch):
+        """Tests that opening runs a single optimize pass, after the schema exists."""
+        applied = []
+
+        def record(conn, pragmas):
+            tables = conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'table'").fetchone()[0]
+            applied.extend((pragma, tables) for pragma in pragmas if "optimize" in pragma)
+            _apply_pragmas(conn, pragmas)
+
+        monkeypatch.setattr("persistence.core.repository._apply_pragmas", record)
+        BingoRepository(str(tmp_path / "test.db")).close()
+        opened = [entry for entry in applied if entry[0] != "PRAGMA optimize"]
+        assert len(opened) == 1
+        assert opened[0][1] > 0  # the tables already exist
+
+    def test_reads_use_read_only_pool(self, tmp_path: Path):
+        """Tests that pooled readers see committed writes but cannot write.
+
+        Validates:
+            - File databases pool read-only connections; ":memory:" does not.
+            - Reads interleaved with writes return the latest committed rows.
+            - close() also closes the pooled readers.
+        """
+        with BingoRepository(":memory:") as memory_repo:
+            assert memory_repo._readers.empty()
+
+        repo = BingoRepository(str(tmp_path / "test.db"), readers=2)
+        reader = repo._readers.get_nowait()
+        with pytest.raises(sqlite3.OperationalError):
+            reader.execute(INSERT_GAME, (3, 30))
+        repo._readers.put(reader)
+
+        for i in range(3):
+            repo.record_game_result("Reader", 3, 30, True, 5 + i)
+            assert repo.get_leaderboard()[0]["games_played"] == i + 1
+            assert len(repo.get_game_history()) == i + 1
+
+        repo.close()
+        assert repo._readers.empty()
+        with pytest.raises(sqlite3.ProgrammingError):
+            reader.execute("SELECT 1")
+
 
 class TestBingoRepositoryConstraints:
     """Tests for database constraints and integrity."""
@@ -435,6 +706,7 @@ class TestBingoRepositoryAnalytics:
             history = repo.get_game_history(limit=5)
 
             assert len(history) == 2
+            assert all(row["played_at"] for row in history)
             assert history[0]["id"] >= history[1]["id"]
             assert {"id", "name", "board_size", "pool_max", "won", "draws_count", "played_at"} <= history[0].keys()
         finally:
@@ -463,5 +735,7 @@ class TestBingoRepositoryAnalytics:
             cur.execute("SELECT COUNT(*) FROM results WHERE draws_count = 0 AND won = 1")
             assert cur.fetchone()[0] == 0
             conn.close()
+            # Counters are rebuilt after the cleanup, so the removed win never ranks
+            assert repo.get_leaderboard() == []
         finally:
             repo.close()
@@ -33,13 +33,11 @@ def test_multiplayer_creates_two_cards_and_names(streamlit_app):
     multiplayer_checkbox = _find_by_label(apptest.checkbox, "Multiplayer mode")
     apptest = multiplayer_checkbox.set_value(True).run()
 
-    # Set both player names
-    p1_input = _find_by_label(apptest.text_input, "Player 1 name")
-    apptest = p1_input.set_value("Alice").run()
-    p2_input = _find_by_label(apptest.text_input, "Player 2 name")
-    apptest = p2_input.set_value("Bob").run()
+    # Set both player names; setup widgets live in a form, so they apply on submit
+    _find_by_label(apptest.text_input, "Player 1 name").set_value("Alice")
+    _find_by_label(apptest.text_input, "Player 2 name").set_value("Bob")
 
-    # Reset to apply settings and create fresh cards
+    # Submit the setup form to apply settings and create fresh cards
     reset_button = _find_by_label(
         apptest.button, "New game / reset"
     )
@@ -49,3 +47,21 @@ def test_multiplayer_creates_two_cards_and_names(streamlit_app):
     assert len(apptest.session_state.cards) == 2
     assert apptest.session_state.player_names == ["Alice", "Bob"]
     assert apptest.session_state.winner_name is None
+
+
+def test_setup_form_applies_board_settings_on_submit(streamlit_app):
+    """Board changes wait for submit, then pick the size's default pool and drop an even-board free center."""
+    apptest = streamlit_app.run()
+
+    _find_by_label(apptest.selectbox, "Board size").set_value(4)
+    _find_by_label(apptest.checkbox, "Free center").set_value(True)
+    apptest = apptest.run()
+    assert apptest.session_state.config["board_size"] == 5  # not applied without submit
+
+    _find_by_label(apptest.selectbox, "Board size").set_value(4)
+    _find_by_label(apptest.checkbox, "Free center").set_value(True)
+    apptest = _find_by_label(apptest.button, "New game / reset").click().run()
+
+    assert not apptest.exception
+    assert apptest.session_state.config == {"board_size": 4, "pool_max": 60, "free_center": False}
+    assert apptest.session_state.cards[0].n == 4